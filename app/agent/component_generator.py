@@ -1,22 +1,40 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from .models import AgentState
 from .logo_generator import generate_professional_logo
-from .code_utils import extract_code_and_css, clean_imports
+from .code_utils import extract_code_and_css
 from .css_utils import clean_css
-from .llm_utils import groq_client, MODEL_NAME
+from .llm_utils import cached_completion
 
-def generate_components(state: AgentState) -> AgentState:
-    """Generate shared React components with professional styling"""
-    
-    # Generate logo first
-    logo_jsx, logo_css = generate_professional_logo(state)
-    
-    # Initialize components
-    state["components"] = {"Logo": logo_jsx}
-    state["component_css"] = {"Logo": logo_css}
-    
-    # Define all components that need to be generated
-    component_specs = {
-        "Navbar": f"""
+logger = logging.getLogger(__name__)
+
+# Rules shared by every component prompt, sent as a byte-identical system
+# message so the provider can reuse the prefix across the calls
+_COMPONENT_REQUIREMENTS = (
+    "COMPONENT REQUIREMENTS:\n"
+    "- Create a functional React component with hooks (useState, useEffect as needed)\n"
+    "- Use Bootstrap 5 classes for layout and basic styling\n"
+    "- Add custom CSS for advanced effects, animations, and professional design\n"
+    "- Import './Component.css' at the top for styles\n"
+    "- Use React Router Link for navigation: import { Link } from 'react-router-dom'\n"
+    "- Use Bootstrap Icons: <i className='bi bi-icon-name'></i>\n"
+    "- Make it fully responsive and accessible\n"
+    "- Add smooth animations and hover effects\n"
+    "- Use glassmorphism and modern design patterns\n"
+    "- Apply the theme colors consistently\n\n"
+    "CRITICAL CSS REQUIREMENTS:\n"
+    "- All CSS selectors must end with space then { not semicolon\n"
+    "- All CSS properties must end with semicolon\n"
+    "- No comma-semicolon combinations\n"
+    "- Use proper CSS syntax: .selector { property: value; }\n"
+    "- Add professional animations and transitions\n\n"
+    "Return the React component in ```jsx block and CSS in ```css block.\n"
+    "No explanations, just the code."
+)
+
+# Per-component design briefs; theme colors are appended at call time
+_COMPONENT_SPECS = {
+    "Navbar": """
 Create a professional, glassmorphism navigation bar with:
 - Sticky positioning with backdrop blur
 - Mobile-responsive hamburger menu with smooth animations
@@ -28,11 +46,9 @@ Create a professional, glassmorphism navigation bar with:
 - Modern gradient borders and shadows
 - CSS custom properties for theming
 Use React hooks (useState, useEffect) for mobile menu toggle and scroll effects.
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Hero": f"""
+""",
+    
+    "Hero": """
 Create a stunning hero section with:
 - Full viewport height with perfect centering
 - Animated gradient backgrounds
@@ -44,11 +60,9 @@ Create a stunning hero section with:
 - Modern animations (fade-in, slide-up, scale)
 - Glassmorphism cards and elements
 - Interactive hover states and particle effects (CSS only)
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Features": f"""
+""",
+    
+    "Features": """
 Create a modern features showcase section with:
 - Grid layout for feature cards
 - Animated icons and hover effects
@@ -58,11 +72,9 @@ Create a modern features showcase section with:
 - Responsive grid (1-2-3 columns based on screen size)
 - Professional typography and spacing
 - Bootstrap icons for feature icons
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Pricing": f"""
+""",
+    
+    "Pricing": """
 Create professional pricing cards with:
 - Modern card design with glassmorphism
 - Recommended plan highlighting
@@ -72,11 +84,9 @@ Create professional pricing cards with:
 - Responsive grid layout
 - Professional styling and spacing
 - Smooth animations and transitions
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Testimonials": f"""
+""",
+    
+    "Testimonials": """
 Create testimonial carousel/grid with:
 - Customer review cards
 - Avatar images and star ratings
@@ -85,11 +95,9 @@ Create testimonial carousel/grid with:
 - Responsive layout
 - Professional typography
 - Hover effects and transitions
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "FAQ": f"""
+""",
+    
+    "FAQ": """
 Create interactive FAQ accordion with:
 - Expandable question/answer sections
 - Smooth accordion animations
@@ -98,11 +106,9 @@ Create interactive FAQ accordion with:
 - Responsive design
 - Search functionality (optional)
 - Modern design patterns
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Newsletter": f"""
+""",
+    
+    "Newsletter": """
 Create newsletter signup component with:
 - Email input with validation
 - Professional form styling
@@ -111,11 +117,9 @@ Create newsletter signup component with:
 - Responsive layout
 - Interactive animations
 - Form submission handling with React hooks
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Footer": f"""
+""",
+    
+    "Footer": """
 Create comprehensive footer with:
 - Multi-column layout
 - Social media links
@@ -124,11 +128,9 @@ Create comprehensive footer with:
 - Professional styling
 - Responsive design
 - Modern spacing and typography
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "ContactButton": f"""
+""",
+    
+    "ContactButton": """
 Create floating contact button with:
 - Fixed positioning (bottom-right)
 - Smooth hover animations
@@ -136,11 +138,9 @@ Create floating contact button with:
 - Professional styling
 - Responsive behavior
 - Interactive states
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """,
-        
-        "Sidebar": f"""
+""",
+    
+    "Sidebar": """
 Create sidebar navigation with:
 - Collapsible design
 - Navigation links
@@ -149,66 +149,39 @@ Create sidebar navigation with:
 - Professional styling
 - Smooth animations
 - Responsive behavior
-Primary color: {state.get('primary_color', '#4f46e5')}
-Secondary color: {state.get('secondary_color', '#06b6d4')}
-        """
-    }
-    
-    # Generate each component
-    for name, description in component_specs.items():
-        try:
-            print(f"Generating component: {name}")
-            
-            response = groq_client.chat.completions.create(
-                model=MODEL_NAME,
-                messages=[{
-                    "role": "user",
-                    "content": (
-                        f"Create a professional, interactive React component named {name}. {description}\n\n"
-                        f"COMPONENT REQUIREMENTS:\n"
-                        f"- Create a functional React component with hooks (useState, useEffect as needed)\n"
-                        f"- Use Bootstrap 5 classes for layout and basic styling\n"
-                        f"- Add custom CSS for advanced effects, animations, and professional design\n"
-                        f"- Import './Component.css' at the top for styles\n"
-                        f"- Use React Router Link for navigation: import {{ Link }} from 'react-router-dom'\n"
-                        f"- Use Bootstrap Icons: <i className='bi bi-icon-name'></i>\n"
-                        f"- Make it fully responsive and accessible\n"
-                        f"- Add smooth animations and hover effects\n"
-                        f"- Use glassmorphism and modern design patterns\n"
-                        f"- Apply the theme colors consistently\n\n"
-                        f"CRITICAL CSS REQUIREMENTS:\n"
-                        f"- All CSS selectors must end with space then {{ not semicolon\n"
-                        f"- All CSS properties must end with semicolon\n"
-                        f"- No comma-semicolon combinations\n"
-                        f"- Use proper CSS syntax: .selector {{ property: value; }}\n"
-                        f"- Add professional animations and transitions\n\n"
-                        f"Return the React component in ```jsx block and CSS in ```css block.\n"
-                        f"No explanations, just the code."
-                    )
-                }],
-                temperature=0.3,
-                max_tokens=2000
-            )
+"""
+}
+
+def _generate_component(name: str, description: str, primary_color: str, secondary_color: str) -> tuple[str, str, str]:
+    """Generate one component; returns (name, jsx, css) with "" for missing parts"""
+    try:
+        logger.info("Generating component: %s", name)
+        
+        content = cached_completion(
+            f"Create a professional, interactive React component named {name}. {description}",
+            system=_COMPONENT_REQUIREMENTS,
+            temperature=0.3,
+            max_tokens=2000,
+            stop_after_blocks=2
+        )
+        
+        js_code, css_code = extract_code_and_css(content)
+        
+        if js_code:
+            logger.info("Generated %s component (%d chars)", name, len(js_code))
+        else:
+            logger.error("Failed to extract JS code for %s", name)
             
-            content = response.choices[0].message.content
-            js_code, css_code = extract_code_and_css(content)
+        if css_code:
+            css_code = clean_css(css_code)
+            logger.info("Generated %s CSS (%d chars)", name, len(css_code))
+        else:
+            logger.warning("No CSS generated for %s", name)
             
-            if js_code:
-                state["components"][name] = clean_imports(js_code)
-                print(f"✅ Generated {name} component ({len(js_code)} chars)")
-            else:
-                print(f"❌ Failed to extract JS code for {name}")
-                
-            if css_code:
-                state["component_css"][name] = clean_css(css_code)
-                print(f"✅ Generated {name} CSS ({len(css_code)} chars)")
-            else:
-                print(f"⚠️ No CSS generated for {name}")
-                
-        except Exception as e:
-            print(f"❌ Error generating component {name}: {e}")
-            # Add a basic fallback component
-            state["components"][name] = f"""
+    except Exception:
+        logger.exception("Error generating component %s, using fallback", name)
+        # Add a basic fallback component
+        js_code = f"""
 import './{name}.css';
 
 export default function {name}() {{
@@ -219,15 +192,49 @@ export default function {name}() {{
     </div>
   );
 }}"""
-            state["component_css"][name] = f"""
+        css_code = f"""
 .{name.lower()}-container {{
   padding: 2rem;
   text-align: center;
-  background: linear-gradient(135deg, {state.get('primary_color', '#4f46e5')}, {state.get('secondary_color', '#06b6d4')});
+  background: linear-gradient(135deg, {primary_color}, {secondary_color});
   color: white;
   border-radius: 1rem;
   margin: 1rem 0;
 }}"""
     
-    print(f"📦 Generated {len(state['components'])} components total")
+    return name, js_code, css_code
+
+def generate_components(state: AgentState) -> AgentState:
+    """Generate shared React components with professional styling"""
+    
+    # Generate logo first
+    logo_jsx, logo_css = generate_professional_logo(state)
+    
+    # Initialize components
+    state["components"] = {"Logo": logo_jsx}
+    state["component_css"] = {"Logo": logo_css}
+    
+    # Theme colors and the footer shared by every component prompt
+    primary_color = state.get('primary_color', '#4f46e5')
+    secondary_color = state.get('secondary_color', '#06b6d4')
+    color_footer = f"Primary color: {primary_color}\nSecondary color: {secondary_color}\n"
+    
+    # Generate components concurrently; the calls are network-bound, so
+    # threads overlap the LLM latency. Results are merged in spec order.
+    # Workers share one Groq client, whose keep-alive pool lets connections
+    # opened here be reused by later calls instead of re-handshaking.
+    with ThreadPoolExecutor(max_workers=len(_COMPONENT_SPECS)) as executor:
+        results = executor.map(
+            lambda spec: _generate_component(
+                spec[0], spec[1] + color_footer, primary_color, secondary_color
+            ),
+            _COMPONENT_SPECS.items()
+        )
+        for name, js_code, css_code in results:
+            if js_code:
+                state["components"][name] = js_code
+            if css_code:
+                state["component_css"][name] = css_code
+    
+    logger.info("Generated %d components total", len(state["components"]))
     return state
\ No newline at end of file
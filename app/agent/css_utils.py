@@ -1,74 +1,70 @@
 import re
+from functools import lru_cache
 
+_SEMIS_BEFORE_BRACE = re.compile(r';+\s*{')
+_COMMA_SEMI = re.compile(r',\s*;\s*')
+_TRAIL_SEMI = re.compile(r';\s*$')
+# Collapses ";;" runs and drops a comma before ";" in one scan
+_PROP_SEMI_FIX = re.compile(r'(?:,\s*)?;+')
+_CSS_LINE_RE = re.compile(r'[^\n]+')
+
+@lru_cache(maxsize=128)
 def clean_css(css_code: str) -> str:
-    """Enhanced CSS cleaning with professional design patterns"""
+    """Enhanced CSS cleaning with professional design patterns; cached since cached LLM replies recur"""
     if not css_code:
         return ""
     
     # Remove any invalid syntax
     cleaned = css_code.replace('class=', 'className=')
     
-    # Split into lines for processing
-    lines = cleaned.split('\n')
-    fixed_lines = []
     in_rule = False
-    in_media = False
-    in_keyframes = False
     brace_count = 0
     
-    for i, line in enumerate(lines):
-        stripped_line = line.strip()
+    def fix_line(match):
+        """Fix a single CSS line; state carries across lines in match order"""
+        nonlocal in_rule, brace_count
+        stripped_line = match.group().strip()
         
-        # Skip empty lines
+        # Whitespace-only lines collapse to empty lines
         if not stripped_line:
-            fixed_lines.append("")
-            continue
+            return ""
         
         # Handle closing braces
         if stripped_line == '}':
-            fixed_lines.append(stripped_line)
             brace_count -= 1
             if brace_count <= 0:
                 in_rule = False
-                in_media = False
-                in_keyframes = False
                 brace_count = 0
-            continue
+            return stripped_line
         
         # Handle CSS selectors
         if stripped_line.endswith('{'):
-            stripped_line = re.sub(r';+\s*{', ' {', stripped_line)
-            stripped_line = re.sub(r',\s*;\s*', ', ', stripped_line)
-            stripped_line = re.sub(r';\s*$', '', stripped_line.rstrip('{')) + ' {'
+            stripped_line = _SEMIS_BEFORE_BRACE.sub(' {', stripped_line)
+            stripped_line = _COMMA_SEMI.sub(', ', stripped_line)
+            stripped_line = _TRAIL_SEMI.sub('', stripped_line.rstrip('{')) + ' {'
             
-            fixed_lines.append(stripped_line)
             in_rule = True
             brace_count += 1
-            continue
+            return stripped_line
         
         # Handle CSS properties
-        if (in_rule or in_media or in_keyframes) and ':' in stripped_line and not stripped_line.startswith('/*'):
+        if in_rule and ':' in stripped_line and not stripped_line.startswith('/*'):
             if not stripped_line.endswith(';'):
                 stripped_line += ';'
             
-            stripped_line = re.sub(r';+', ';', stripped_line)
-            stripped_line = re.sub(r',\s*;', ';', stripped_line)
+            stripped_line = _PROP_SEMI_FIX.sub(';', stripped_line)
             
             if not stripped_line.startswith(('  ', '\t')):
                 stripped_line = '  ' + stripped_line
-            
-            fixed_lines.append(stripped_line)
-            continue
         
-        fixed_lines.append(stripped_line)
+        return stripped_line
     
-    result = '\n'.join(fixed_lines)
+    # Single pass over every non-empty line; newlines are left in place
+    result = _CSS_LINE_RE.sub(fix_line, cleaned)
     return add_professional_css_patterns(result)
 
-def add_professional_css_patterns(css_code: str) -> str:
-    """Add professional design patterns to CSS"""
-    
-    css_variables = """
+# Theme variables, keyframes and utilities prepended to CSS without a :root block
+_CSS_VARIABLES_PREFIX = """
 :root {
   /* Color Palette */
   --primary-color: #4f46e5;
@@ -166,8 +162,10 @@ def add_professional_css_patterns(css_code: str) -> str:
   transition: all var(--transition-base);
 }
 """
-    
+
+def add_professional_css_patterns(css_code: str) -> str:
+    """Add professional design patterns to CSS"""
     if ':root' not in css_code:
-        css_code = css_variables + '\n\n' + css_code
+        css_code = _CSS_VARIABLES_PREFIX + '\n\n' + css_code
     
     return css_code
\ No newline at end of file
@@ -1,32 +1,320 @@
+import copy
+import hashlib
 import json
-import re
-from groq import Groq
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
-groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# groq (and httpx under it) is imported on first use, not at import time
+if TYPE_CHECKING:
+    from groq import Groq
+
+# orjson is optional; its decode errors subclass json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 needs h2 (in requirements.txt) and falls back to HTTP/1.1 without it;
+# with h2, concurrent component and page calls share one multiplexed TLS
+# connection instead of opening one each
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+logger = logging.getLogger(__name__)
+
 MODEL_NAME = "llama-3.1-70b-versatile"
 
+# Context window shared by prompt and reply, and the headroom kept for the
+# chat template when clamping max_tokens
+_MODEL_CONTEXT_TOKENS = 131072
+_PROMPT_TOKEN_MARGIN = 128
+
+# The Groq SDK retries connection errors, 408/409/429 and 5xx itself, with
+# jittered exponential backoff (0.5s up to 8s) that honors Retry-After;
+# other 4xx errors are raised at once. Only the attempt count is ours.
+_LLM_MAX_RETRIES = 3
+
+# Idle pooled connections survive this long (httpx defaults to 5s), so a
+# website requested a minute after the last one reuses its TLS session
+_KEEPALIVE_EXPIRY = 120.0
+
+class LLMError(Exception):
+    """An LLM call failed: API error, timeout or missing client configuration"""
+
+# functools.cache alone lets concurrent first callers (the component and page
+# fan-out) each build a client, leaking every pool but the cached one
+_groq_client_lock = threading.Lock()
+
+def get_groq_client() -> "Groq":
+    """Return the shared Groq client, built on first use so importing stays cheap"""
+    with _groq_client_lock:
+        return _build_groq_client()
+
+@cache
+def _build_groq_client() -> "Groq":
+    """Build the Groq client; callers hold _groq_client_lock"""
+    import httpx
+    from groq import DefaultHttpxClient, Groq
+    
+    load_dotenv()
+    # Same pool sizes as the SDK default, with a longer keep-alive
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=_KEEPALIVE_EXPIRY)
+    return Groq(
+        api_key=os.getenv("GROQ_API_KEY"),
+        max_retries=_LLM_MAX_RETRIES,
+        http_client=DefaultHttpxClient(http2=_HTTP2, limits=limits)
+    )
+
+def close_groq_client() -> None:
+    """Close the shared client's connection pool, if it was ever opened"""
+    with _groq_client_lock:
+        if _build_groq_client.cache_info().currsize:
+            _build_groq_client().close()
+            _build_groq_client.cache_clear()
+
+# In-process LRU of LLM replies keyed by a hash of model, params and prompt
+_RESPONSE_CACHE_SIZE = 256
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Replies can also persist in SQLite so development reruns with the same
+# prompts skip the API; set P2R_LLM_CACHE=1 to turn the disk layer on. Rows
+# expire after a week so a poor generation is not replayed forever; bump _CACHE_VERSION whenever
+# what counts as a usable reply changes, which orphans every older entry.
+_DISK_CACHE_PATH = Path(
+    os.getenv("P2R_LLM_CACHE_PATH", "~/.cache/prompt2react/llm_cache.sqlite3")
+).expanduser()
+_DISK_CACHE_MAX_AGE = 7 * 24 * 3600
+_CACHE_VERSION = 1
+
+@cache
+def _get_disk_cache() -> sqlite3.Connection | None:
+    """Open the persistent reply cache, or None when disabled or unavailable; callers hold _response_cache_lock"""
+    if os.getenv("P2R_LLM_CACHE", "0") != "1":
+        return None
+    try:
+        _DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Shared across worker threads; every use holds _response_cache_lock
+        connection = sqlite3.connect(_DISK_CACHE_PATH, check_same_thread=False)
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS replies "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            connection.execute("DELETE FROM replies WHERE created_at < ?", (time.time() - _DISK_CACHE_MAX_AGE,))
+        return connection
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("LLM disk cache disabled: %s", e)
+        return None
+
+# Prompts used to fill in fields the user left empty
+_FIELD_PROMPTS = {
+    "website_desc": "Generate a professional, concise description (1-2 sentences) for a modern SaaS/tech platform.",
+    "landing_desc": "Generate a compelling hero section welcome message (1-2 sentences) that encourages visitors to explore the platform.",
+    "main_desc": "Generate a description for the main features page that showcases the platform's capabilities.",
+    "checkout_desc": "Generate an encouraging checkout page description that builds trust and motivates purchase completion.",
+    "primary_color": "Generate a modern, professional primary brand color in hex format (e.g., #4f46e5). Return only the hex color.",
+    "secondary_color": "Generate a complementary secondary brand color in hex format (e.g., #06b6d4). Return only the hex color.",
+    "logo_url": "Return an empty string - logos will be text-based.",
+    "nav_links": """Generate 5 navigation links as JSON array. Format: [{"name": "Home", "url": "/"}, {"name": "Features", "url": "/main"}, {"name": "Pricing", "url": "/#pricing"}, {"name": "About", "url": "/#about"}, {"name": "Get Started", "url": "/checkout"}]. Return only valid JSON array.""",
+    "features": """Generate 6 compelling features as JSON array. Format: [{"icon": "bi-star", "title": "Feature Name", "description": "Brief feature description"}]. Use Bootstrap icon names (bi-*). Return only valid JSON array.""",
+    "pricing": """Generate 3 pricing plans as JSON array. Format: [{"name": "Basic", "price": "$9/month", "features": ["Feature 1", "Feature 2", "Feature 3"], "recommended": false}, {"name": "Pro", "price": "$29/month", "features": ["Everything in Basic", "Feature 4", "Feature 5"], "recommended": true}, {"name": "Enterprise", "price": "$99/month", "features": ["Everything in Pro", "Feature 6", "Feature 7"], "recommended": false}]. Return only valid JSON array.""",
+    "testimonials": """Generate 4 customer testimonials as JSON array. Format: [{"name": "John Smith", "quote": "Great platform! Really improved our productivity.", "avatar": "https://via.placeholder.com/80x80/4f46e5/ffffff?text=JS"}]. Return only valid JSON array.""",
+    "faqs": """Generate 6 FAQs as JSON array. Format: [{"question": "How does it work?", "answer": "Detailed answer explaining the process."}]. Return only valid JSON array."""
+}
+
+# Fallback field values; get_default_value hands out copies, since the
+# returned lists end up in per-request state
+_DEFAULT_VALUES = {
+    "website_desc": "Modern AI-powered platform designed to boost productivity and streamline workflows",
+    "landing_desc": "Welcome to the future of productivity. Transform how you work with our innovative platform.",
+    "main_desc": "Discover powerful features designed to enhance your workflow and boost team collaboration.",
+    "checkout_desc": "Join thousands of satisfied customers. Choose your plan and start your journey today.",
+    "primary_color": "#4f46e5",
+    "secondary_color": "#06b6d4",
+    "logo_url": "",
+    "nav_links": [
+        {"name": "Home", "url": "/"},
+        {"name": "Features", "url": "/main"},
+        {"name": "Pricing", "url": "/#pricing"},
+        {"name": "About", "url": "/#about"},
+        {"name": "Get Started", "url": "/checkout"}
+    ],
+    "features": [
+        {"icon": "bi-lightning", "title": "Fast & Efficient", "description": "Lightning-fast performance for all your needs"},
+        {"icon": "bi-shield-check", "title": "Secure & Safe", "description": "Enterprise-grade security for your data"},
+        {"icon": "bi-people", "title": "Team Collaboration", "description": "Work together seamlessly with your team"},
+        {"icon": "bi-graph-up", "title": "Analytics & Insights", "description": "Detailed analytics to track your progress"},
+        {"icon": "bi-mobile", "title": "Mobile Ready", "description": "Access from anywhere on any device"},
+        {"icon": "bi-headset", "title": "24/7 Support", "description": "Round-the-clock customer support"}
+    ],
+    "pricing": [
+        {"name": "Starter", "price": "$9/month", "features": ["5 Projects", "10GB Storage", "Email Support"], "recommended": False},
+        {"name": "Professional", "price": "$29/month", "features": ["Unlimited Projects", "100GB Storage", "Priority Support", "Advanced Analytics"], "recommended": True},
+        {"name": "Enterprise", "price": "$99/month", "features": ["Everything in Pro", "Unlimited Storage", "Dedicated Support", "Custom Integrations"], "recommended": False}
+    ],
+    "testimonials": [
+        {"name": "Sarah Johnson", "quote": "This platform has transformed how we work. Highly recommended!", "avatar": "https://via.placeholder.com/80x80/4f46e5/ffffff?text=SJ"},
+        {"name": "Mike Chen", "quote": "Incredible features and excellent support team. Worth every penny.", "avatar": "https://via.placeholder.com/80x80/06b6d4/ffffff?text=MC"},
+        {"name": "Emily Davis", "quote": "User-friendly interface with powerful capabilities. Love it!", "avatar": "https://via.placeholder.com/80x80/10b981/ffffff?text=ED"},
+        {"name": "Alex Rodriguez", "quote": "Game-changer for our productivity. Couldn't imagine working without it.", "avatar": "https://via.placeholder.com/80x80/f59e0b/ffffff?text=AR"}
+    ],
+    "faqs": [
+        {"question": "How do I get started?", "answer": "Simply sign up for an account and follow our guided onboarding process."},
+        {"question": "Is there a free trial?", "answer": "Yes, we offer a 14-day free trial with full access to all features."},
+        {"question": "Can I cancel anytime?", "answer": "Absolutely! You can cancel your subscription at any time with no penalties."},
+        {"question": "What payment methods do you accept?", "answer": "We accept all major credit cards, PayPal, and bank transfers."},
+        {"question": "Is my data secure?", "answer": "Yes, we use enterprise-grade encryption and security measures to protect your data."},
+        {"question": "Do you offer customer support?", "answer": "Yes, we provide 24/7 customer support via email, chat, and phone."}
+    ]
+}
+
+def cached_completion(prompt: str, temperature: float, max_tokens: int, stop_after_blocks: int | None = None,
+                      system: str | None = None, use_cache: bool = True, **kwargs) -> str:
+    """Get the LLM reply to a single user prompt, reusing replies to prompts that match up to whitespace.
+    
+    With stop_after_blocks set, the reply is streamed and cut off as soon as
+    that many fenced code blocks have closed. A system message, if given, is
+    sent first so calls sharing it also share a cacheable prompt prefix.
+    Only complete replies are cached: those that reached all of their code
+    blocks, or without stop_after_blocks, those the model finished itself.
+    With use_cache=False the call neither reads nor stores cached replies.
+    """
+    # Prompts differing only in whitespace (re-wrapped or padded descriptions)
+    # share a key, so they reuse one reply
+    key = hashlib.blake2b(
+        f"{_CACHE_VERSION}\0{MODEL_NAME}\0{temperature}\0{max_tokens}\0{system or ''}\0{' '.join(prompt.split())}".encode(),
+        digest_size=16
+    ).hexdigest()
+    if use_cache:
+        with _response_cache_lock:
+            # Opened under the lock so concurrent first calls share one connection
+            disk_cache = _get_disk_cache()
+            if key in _response_cache:
+                _response_cache.move_to_end(key)
+                return _response_cache[key]
+        
+            if disk_cache is not None:
+                try:
+                    row = disk_cache.execute(
+                        "SELECT content FROM replies WHERE key = ? AND created_at >= ?",
+                        (key, time.time() - _DISK_CACHE_MAX_AGE)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning("LLM disk cache read failed: %s", e)
+                    row = None
+                if row is not None:
+                    _remember_response(key, row[0])
+                    return row[0]
+    
+    max_tokens = _fit_max_tokens(max_tokens, prompt, system)
+    
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+    
+    import httpx
+    from groq import GroqError
+    
+    try:
+        response = get_groq_client().chat.completions.create(
+            model=MODEL_NAME,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stop_after_blocks is not None,
+            **kwargs
+        )
+        if stop_after_blocks is None:
+            choice = response.choices[0]
+            content = choice.message.content
+            complete = choice.finish_reason == "stop"
+        else:
+            try:
+                content, complete = _read_until_blocks(response, stop_after_blocks)
+            finally:
+                response.close()
+    # GroqError covers API errors, a missing API key, and connection errors and
+    # timeouts before the reply starts; a stream that drops mid-reply raises
+    # httpx errors (ReadError, RemoteProtocolError, ReadTimeout) directly
+    except (GroqError, httpx.HTTPError) as e:
+        raise LLMError(str(e)) from e
+    
+    if content is None:
+        raise LLMError("LLM reply had no content")
+    
+    # Replies cut off by max_tokens or missing a code block are returned for
+    # this call to salvage, but never cached, so the next call retries
+    if not (complete and use_cache):
+        return content
+    
+    with _response_cache_lock:
+        _remember_response(key, content)
+        if disk_cache is not None:
+            try:
+                with disk_cache:
+                    disk_cache.execute(
+                        "INSERT OR REPLACE INTO replies (key, content, created_at) VALUES (?, ?, ?)",
+                        (key, content, time.time())
+                    )
+            except sqlite3.Error as e:
+                logger.warning("LLM disk cache write failed: %s", e)
+    
+    return content
+
+def _prompt_tokens(text: str) -> int:
+    """Estimate prompt tokens at ~3 characters per token, which overestimates English text and code"""
+    return len(text) // 3 + 1
+
+def _fit_max_tokens(max_tokens: int, prompt: str, system: str | None) -> int:
+    """Clamp the reply cap so prompt and reply fit the context window"""
+    prompt_tokens = _prompt_tokens(prompt) + (_prompt_tokens(system) if system else 0)
+    available = _MODEL_CONTEXT_TOKENS - prompt_tokens - _PROMPT_TOKEN_MARGIN
+    if available <= 0:
+        raise LLMError(f"Prompt of ~{prompt_tokens} tokens does not fit the {_MODEL_CONTEXT_TOKENS}-token context window")
+    return min(max_tokens, available)
+
+def _read_until_blocks(stream, blocks: int) -> tuple[str, bool]:
+    """Collect a streamed reply, stopping once `blocks` code fences have closed; the caller closes the stream.
+    
+    Returns the reply and whether all of those blocks closed.
+    """
+    content = ""
+    fences = 0
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        # Back up two characters so a fence split across chunks is still seen
+        scan_from = max(len(content) - 2, 0)
+        content += delta
+        fences += content.count("```", scan_from)
+        if fences >= 2 * blocks:
+            return content, True
+    return content, False
+
+def _remember_response(key: str, content: str) -> None:
+    """Add a reply to the in-process LRU; caller holds _response_cache_lock"""
+    _response_cache[key] = content
+    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
 def llm_fill_field(field_name: str, field_description: str, context: dict) -> any:
     """Use LLM to generate a default value for a missing field"""
     
-    field_prompts = {
-        "website_desc": "Generate a professional, concise description (1-2 sentences) for a modern SaaS/tech platform.",
-        "landing_desc": "Generate a compelling hero section welcome message (1-2 sentences) that encourages visitors to explore the platform.",
-        "main_desc": "Generate a description for the main features page that showcases the platform's capabilities.",
-        "checkout_desc": "Generate an encouraging checkout page description that builds trust and motivates purchase completion.",
-        "primary_color": "Generate a modern, professional primary brand color in hex format (e.g., #4f46e5). Return only the hex color.",
-        "secondary_color": "Generate a complementary secondary brand color in hex format (e.g., #06b6d4). Return only the hex color.",
-        "logo_url": "Return an empty string - logos will be text-based.",
-        "nav_links": """Generate 5 navigation links as JSON array. Format: [{"name": "Home", "url": "/"}, {"name": "Features", "url": "/main"}, {"name": "Pricing", "url": "/#pricing"}, {"name": "About", "url": "/#about"}, {"name": "Get Started", "url": "/checkout"}]. Return only valid JSON array.""",
-        "features": """Generate 6 compelling features as JSON array. Format: [{"icon": "bi-star", "title": "Feature Name", "description": "Brief feature description"}]. Use Bootstrap icon names (bi-*). Return only valid JSON array.""",
-        "pricing": """Generate 3 pricing plans as JSON array. Format: [{"name": "Basic", "price": "$9/month", "features": ["Feature 1", "Feature 2", "Feature 3"], "recommended": false}, {"name": "Pro", "price": "$29/month", "features": ["Everything in Basic", "Feature 4", "Feature 5"], "recommended": true}, {"name": "Enterprise", "price": "$99/month", "features": ["Everything in Pro", "Feature 6", "Feature 7"], "recommended": false}]. Return only valid JSON array.""",
-        "testimonials": """Generate 4 customer testimonials as JSON array. Format: [{"name": "John Smith", "quote": "Great platform! Really improved our productivity.", "avatar": "https://via.placeholder.com/80x80/4f46e5/ffffff?text=JS"}]. Return only valid JSON array.""",
-        "faqs": """Generate 6 FAQs as JSON array. Format: [{"question": "How does it work?", "answer": "Detailed answer explaining the process."}]. Return only valid JSON array."""
-    }
-    
-    prompt = field_prompts.get(field_name, f"Generate appropriate content for {field_name}: {field_description}")
+    prompt = _FIELD_PROMPTS.get(field_name, f"Generate appropriate content for {field_name}: {field_description}")
     
     # Add context if available
     if context:
@@ -37,25 +325,23 @@ def llm_fill_field(field_name: str, field_description: str, context: dict) -> an
     prompt += f"\n\nReturn ONLY the requested content in the exact format specified. No explanations or additional text."
     
     try:
-        response = groq_client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": prompt}],
+        content = cached_completion(
+            prompt,
             temperature=0.7,
             max_tokens=1000,
+            use_cache=False,  # Fills are meant to vary between requests
             timeout=30  # Add timeout
-        )
-        
-        content = response.choices[0].message.content.strip()
+        ).strip()
         
         # Try to parse JSON for array fields
         if field_name in ["nav_links", "features", "pricing", "testimonials", "faqs"]:
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError:
                 # Extract JSON from content if wrapped in markdown
-                json_match = re.search(r'\[.*\]', content, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
+                start, end = content.find('['), content.rfind(']')
+                if start != -1 and end > start:
+                    return _json_loads(content[start:end + 1])
                 
                 # Return default values if JSON parsing fails
                 return get_default_value(field_name)
@@ -63,53 +349,9 @@ def llm_fill_field(field_name: str, field_description: str, context: dict) -> an
         return content
         
     except Exception as e:
-        print(f"Error generating field {field_name}: {e}")
+        logger.warning("Error generating field %s, using default: %s", field_name, e)
         return get_default_value(field_name)
 
 def get_default_value(field_name: str):
     """Get default values for fields"""
-    defaults = {
-        "website_desc": "Modern AI-powered platform designed to boost productivity and streamline workflows",
-        "landing_desc": "Welcome to the future of productivity. Transform how you work with our innovative platform.",
-        "main_desc": "Discover powerful features designed to enhance your workflow and boost team collaboration.",
-        "checkout_desc": "Join thousands of satisfied customers. Choose your plan and start your journey today.",
-        "primary_color": "#4f46e5",
-        "secondary_color": "#06b6d4",
-        "logo_url": "",
-        "nav_links": [
-            {"name": "Home", "url": "/"},
-            {"name": "Features", "url": "/main"},
-            {"name": "Pricing", "url": "/#pricing"},
-            {"name": "About", "url": "/#about"},
-            {"name": "Get Started", "url": "/checkout"}
-        ],
-        "features": [
-            {"icon": "bi-lightning", "title": "Fast & Efficient", "description": "Lightning-fast performance for all your needs"},
-            {"icon": "bi-shield-check", "title": "Secure & Safe", "description": "Enterprise-grade security for your data"},
-            {"icon": "bi-people", "title": "Team Collaboration", "description": "Work together seamlessly with your team"},
-            {"icon": "bi-graph-up", "title": "Analytics & Insights", "description": "Detailed analytics to track your progress"},
-            {"icon": "bi-mobile", "title": "Mobile Ready", "description": "Access from anywhere on any device"},
-            {"icon": "bi-headset", "title": "24/7 Support", "description": "Round-the-clock customer support"}
-        ],
-        "pricing": [
-            {"name": "Starter", "price": "$9/month", "features": ["5 Projects", "10GB Storage", "Email Support"], "recommended": False},
-            {"name": "Professional", "price": "$29/month", "features": ["Unlimited Projects", "100GB Storage", "Priority Support", "Advanced Analytics"], "recommended": True},
-            {"name": "Enterprise", "price": "$99/month", "features": ["Everything in Pro", "Unlimited Storage", "Dedicated Support", "Custom Integrations"], "recommended": False}
-        ],
-        "testimonials": [
-            {"name": "Sarah Johnson", "quote": "This platform has transformed how we work. Highly recommended!", "avatar": "https://via.placeholder.com/80x80/4f46e5/ffffff?text=SJ"},
-            {"name": "Mike Chen", "quote": "Incredible features and excellent support team. Worth every penny.", "avatar": "https://via.placeholder.com/80x80/06b6d4/ffffff?text=MC"},
-            {"name": "Emily Davis", "quote": "User-friendly interface with powerful capabilities. Love it!", "avatar": "https://via.placeholder.com/80x80/10b981/ffffff?text=ED"},
-            {"name": "Alex Rodriguez", "quote": "Game-changer for our productivity. Couldn't imagine working without it.", "avatar": "https://via.placeholder.com/80x80/f59e0b/ffffff?text=AR"}
-        ],
-        "faqs": [
-            {"question": "How do I get started?", "answer": "Simply sign up for an account and follow our guided onboarding process."},
-            {"question": "Is there a free trial?", "answer": "Yes, we offer a 14-day free trial with full access to all features."},
-            {"question": "Can I cancel anytime?", "answer": "Absolutely! You can cancel your subscription at any time with no penalties."},
-            {"question": "What payment methods do you accept?", "answer": "We accept all major credit cards, PayPal, and bank transfers."},
-            {"question": "Is my data secure?", "answer": "Yes, we use enterprise-grade encryption and security measures to protect your data."},
-            {"question": "Do you offer customer support?", "answer": "Yes, we provide 24/7 customer support via email, chat, and phone."}
-        ]
-    }
-    
-    return defaults.get(field_name, "")
\ No newline at end of file
+    return copy.deepcopy(_DEFAULT_VALUES.get(field_name, ""))
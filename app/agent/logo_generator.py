@@ -1,166 +1,212 @@
 import re
+from functools import lru_cache
+from operator import itemgetter
 from .models import AgentState
 
-def generate_professional_logo(state: AgentState) -> tuple[str, str]:
-    """Generate a professional text-based logo with CSS animations"""
-    
-    website_desc = state.get("website_desc", "Company")
-    primary_color = state.get("primary_color", "#4f46e5")
-    secondary_color = state.get("secondary_color", "#06b6d4")
-    
-    # Extract company name from description
-    company_name = website_desc.split(" - ")[0].strip() if " - " in website_desc else website_desc.split()[0]
-    
-    logo_jsx = f"""import React from 'react';
+_COMPANY_NAME_PATTERNS = (
+    re.compile(r'^([A-Z][a-zA-Z0-9]*(?:[A-Z][a-zA-Z0-9]*)*)\s*[-:]'),  # "TaskFlow -" or "TaskFlow:"
+    re.compile(r'([A-Z][a-zA-Z0-9]*(?:[A-Z][a-zA-Z0-9]*)*)'),  # Any CamelCase word
+)
+
+# Whole-word keywords for each logo style
+_WORD_RE = re.compile(r'[a-z]+')
+_TECH_WORDS = frozenset({'ai', 'tech', 'software', 'platform', 'app', 'digital', 'cloud', 'data'})
+_CREATIVE_WORDS = frozenset({'creative', 'design', 'art', 'studio', 'agency', 'media'})
+_CORPORATE_WORDS = frozenset({'corporate', 'business', 'enterprise', 'consulting', 'finance', 'professional'})
+# Single keyword -> style table so each word costs one dict lookup
+_STYLE_BY_WORD = {
+    **dict.fromkeys(_CORPORATE_WORDS, "corporate"),
+    **dict.fromkeys(_CREATIVE_WORDS, "creative"),
+    **dict.fromkeys(_TECH_WORDS, "tech"),
+}
+
+# Fields the default logo reads; initialize_state always sets all three
+_LOGO_STATE_FIELDS = itemgetter("website_desc", "primary_color", "secondary_color")
+
+_TEMPLATE_TOKEN_RE = re.compile(r'__(COMPANY_NAME|PRIMARY_COLOR|SECONDARY_COLOR)__')
+
+def _split_template(template: str, *tokens: str) -> tuple[str, ...]:
+    """Split a template into the literal runs around its tokens, which must appear in the given order"""
+    pieces = _TEMPLATE_TOKEN_RE.split(template)
+    if tuple(pieces[1::2]) != tokens:
+        raise ValueError(f"Template tokens {pieces[1::2]} do not match {list(tokens)}")
+    return tuple(pieces[0::2])
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_SPACE_RE = re.compile(r' ?([{};]) ?')
+
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace; safe for the quote-free logo templates"""
+    css = _CSS_SPACE_RE.sub(' ', _CSS_COMMENT_RE.sub('', css))
+    return _CSS_PUNCT_SPACE_RE.sub(r'\1', css)
+
+def _split_css_template(template: str, *tokens: str) -> tuple[str, ...]:
+    """Split a CSS template like _split_template, minifying it under python -O"""
+    if not __debug__:
+        template = _minify_css(template).strip()
+    return _split_template(template, *tokens)
+
+# Logo templates are split at import so rendering is a single str.join;
+# the __UPPER_CASE__ tokens mark where the name and colors are spliced in
+_PROFESSIONAL_LOGO_JSX = _split_template("""import React from 'react';
 import './Logo.css';
 
-export default function Logo({{ className = '', size = 'md' }}) {{
+export default function Logo({ className = '', size = 'md' }) {
   return (
-    <div className={{`logo-container logo-${{size}} ${{className}}`}}>
+    <div className={`logo-container logo-${size} ${className}`}>
       <div className="logo-text">
-        <span className="company-name">{company_name}</span>
+        <span className="company-name">__COMPANY_NAME__</span>
         <div className="logo-accent"></div>
       </div>
     </div>
   );
-}}"""
+}""", "COMPANY_NAME")
 
-    logo_css = f""".logo-container {{
+_PROFESSIONAL_LOGO_CSS = _split_css_template(""".logo-container {
   display: inline-flex;
   align-items: center;
   cursor: pointer;
   transition: all 0.3s ease;
-}}
+}
 
-.logo-text {{
+.logo-text {
   position: relative;
   display: flex;
   align-items: center;
   font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-}}
+}
 
-.company-name {{
-  font-size: 1.75rem;
+.company-name {
+  font-size: clamp(1.5rem, 3.5vw, 1.75rem);
   font-weight: 800;
-  background: linear-gradient(135deg, {primary_color} 0%, {secondary_color} 100%);
+  background: linear-gradient(135deg, __PRIMARY_COLOR__ 0%, __SECONDARY_COLOR__ 100%);
   -webkit-background-clip: text;
   background-clip: text;
   -webkit-text-fill-color: transparent;
   letter-spacing: -0.02em;
   transition: all 0.3s ease;
-}}
+}
 
-.logo-accent {{
+.logo-accent {
   width: 8px;
   height: 8px;
   border-radius: 50%;
-  background: linear-gradient(135deg, {primary_color} 0%, {secondary_color} 100%);
+  background: linear-gradient(135deg, __PRIMARY_COLOR__ 0%, __SECONDARY_COLOR__ 100%);
   margin-left: 4px;
   animation: pulse 2s infinite;
-}}
+}
 
-.logo-container:hover .company-name {{
+.logo-container:hover .company-name {
   transform: scale(1.05);
   filter: brightness(1.1);
-}}
+}
 
-.logo-container:hover .logo-accent {{
+.logo-container:hover .logo-accent {
   animation: bounce 0.6s ease-in-out;
-}}
+}
 
 /* Size variants */
-.logo-sm .company-name {{
+.logo-sm .company-name {
   font-size: 1.25rem;
-}}
+}
 
-.logo-sm .logo-accent {{
+.logo-sm .logo-accent {
   width: 6px;
   height: 6px;
-}}
+}
 
-.logo-lg .company-name {{
-  font-size: 2.5rem;
-}}
+.logo-lg .company-name {
+  font-size: clamp(2rem, 5vw, 2.5rem);
+}
 
-.logo-lg .logo-accent {{
+.logo-lg .logo-accent {
   width: 12px;
   height: 12px;
-}}
+}
 
-.logo-xl .company-name {{
-  font-size: 3rem;
-}}
+.logo-xl .company-name {
+  font-size: clamp(2.5rem, 6vw, 3rem);
+}
 
-.logo-xl .logo-accent {{
+.logo-xl .logo-accent {
   width: 16px;
   height: 16px;
-}}
+}
 
 /* Animations */
-@keyframes pulse {{
-  0% {{
+@keyframes pulse {
+  0% {
     transform: scale(1);
     opacity: 1;
-  }}
-  50% {{
+  }
+  50% {
     transform: scale(1.2);
     opacity: 0.7;
-  }}
-  100% {{
+  }
+  100% {
     transform: scale(1);
     opacity: 1;
-  }}
-}}
+  }
+}
 
-@keyframes bounce {{
-  0%, 20%, 53%, 80%, 100% {{
+@keyframes bounce {
+  0%, 20%, 53%, 80%, 100% {
     transform: translate3d(0,0,0) scale(1);
-  }}
-  40%, 43% {{
+  }
+  40%, 43% {
     transform: translate3d(0, -8px, 0) scale(1.1);
-  }}
-  70% {{
+  }
+  70% {
     transform: translate3d(0, -4px, 0) scale(1.05);
-  }}
-  90% {{
+  }
+  90% {
     transform: translate3d(0, -1px, 0) scale(1.02);
-  }}
-}}
+  }
+}
 
 /* Dark mode support */
-@media (prefers-color-scheme: dark) {{
-  .company-name {{
+@media (prefers-color-scheme: dark) {
+  .company-name {
     filter: brightness(1.2);
-  }}
-}}
-
-/* Responsive adjustments */
-@media (max-width: 768px) {{
-  .logo-container .company-name {{
-    font-size: 1.5rem;
-  }}
-  
-  .logo-lg .company-name {{
-    font-size: 2rem;
-  }}
-  
-  .logo-xl .company-name {{
-    font-size: 2.5rem;
-  }}
-}}"""
+  }
+}""", "PRIMARY_COLOR", "SECONDARY_COLOR", "PRIMARY_COLOR", "SECONDARY_COLOR")
+
+def generate_professional_logo(state: AgentState) -> tuple[str, str]:
+    """Generate a professional text-based logo with CSS animations"""
+    
+    try:
+        website_desc, primary_color, secondary_color = _LOGO_STATE_FIELDS(state)
+    except KeyError:
+        website_desc = state.get("website_desc", "Company")
+        primary_color = state.get("primary_color", "#4f46e5")
+        secondary_color = state.get("secondary_color", "#06b6d4")
+    
+    # Extract company name from description
+    head, separator, _ = website_desc.partition(" - ")
+    company_name = head.strip() if separator else website_desc.split(None, 1)[0]
+    
+    return render_professional_logo(company_name, primary_color, secondary_color)
+
+@lru_cache(maxsize=128)
+def render_professional_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple[str, str]:
+    """Render the professional logo JSX and CSS; cached per name/color triple"""
+    logo_jsx = "".join((_PROFESSIONAL_LOGO_JSX[0], company_name, _PROFESSIONAL_LOGO_JSX[1]))
+    logo_css = "".join((
+        _PROFESSIONAL_LOGO_CSS[0], primary_color,
+        _PROFESSIONAL_LOGO_CSS[1], secondary_color,
+        _PROFESSIONAL_LOGO_CSS[2], primary_color,
+        _PROFESSIONAL_LOGO_CSS[3], secondary_color,
+        _PROFESSIONAL_LOGO_CSS[4]
+    ))
 
     return logo_jsx, logo_css
 
 def extract_company_name(website_desc: str) -> str:
     """Extract company name from website description"""
     # Look for patterns like "CompanyName -" or "CompanyName:"
-    patterns = [
-        r'^([A-Z][a-zA-Z0-9]*(?:[A-Z][a-zA-Z0-9]*)*)\s*[-:]',  # "TaskFlow -" or "TaskFlow:"
-        r'([A-Z][a-zA-Z0-9]*(?:[A-Z][a-zA-Z0-9]*)*)',  # Any CamelCase word
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, website_desc)
+    for pattern in _COMPANY_NAME_PATTERNS:
+        match = pattern.search(website_desc)
         if match:
             return match.group(1)
     
@@ -173,25 +219,27 @@ def extract_company_name(website_desc: str) -> str:
 
 def determine_logo_style(website_desc: str) -> str:
     """Determine logo style based on website description"""
-    desc_lower = website_desc.lower()
+    # Tech outranks creative, which outranks corporate
+    styles = set()
+    for word in _WORD_RE.findall(website_desc.lower()):
+        style = _STYLE_BY_WORD.get(word)
+        if style == "tech":
+            return "tech"
+        if style:
+            styles.add(style)
     
-    if any(word in desc_lower for word in ['ai', 'tech', 'software', 'platform', 'app', 'digital', 'cloud', 'data']):
-        return "tech"
-    elif any(word in desc_lower for word in ['creative', 'design', 'art', 'studio', 'agency', 'media']):
+    if "creative" in styles:
         return "creative"
-    elif any(word in desc_lower for word in ['corporate', 'business', 'enterprise', 'consulting', 'finance', 'professional']):
+    elif "corporate" in styles:
         return "corporate"
     else:
         return "modern"
 
-def generate_tech_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
-    """Generate tech-style logo with geometric elements"""
-    
-    logo_jsx = f'''
-import {{ Link }} from 'react-router-dom';
+_TECH_LOGO_JSX = _split_template('''
+import { Link } from 'react-router-dom';
 import './Logo.css';
 
-export default function Logo() {{
+export default function Logo() {
   return (
     <Link to="/" className="logo-link tech-logo">
       <div className="logo-icon">
@@ -204,186 +252,201 @@ export default function Logo() {{
           <div className="cube-face cube-bottom"></div>
         </div>
       </div>
-      <span className="logo-text">{company_name}</span>
+      <span className="logo-text">__COMPANY_NAME__</span>
     </Link>
   );
-}}'''
-    
-    logo_css = f'''
-.tech-logo {{
+}''', "COMPANY_NAME")
+
+_TECH_LOGO_CSS = _split_css_template('''
+.tech-logo {
   display: inline-flex;
   align-items: center;
   gap: var(--space-sm, 0.5rem);
   text-decoration: none;
   transition: all var(--transition-base, 0.3s ease);
-}}
+}
 
-.tech-logo:hover {{
+.tech-logo:hover {
   transform: scale(1.05);
-}}
+}
 
-.logo-icon {{
+.logo-icon {
   position: relative;
   width: 32px;
   height: 32px;
   perspective: 100px;
-}}
+}
 
-.logo-cube {{
+.logo-cube {
   position: relative;
   width: 100%;
   height: 100%;
   transform-style: preserve-3d;
   animation: rotateCube 6s infinite linear;
-}}
+}
 
-.cube-face {{
+.cube-face {
   position: absolute;
   width: 32px;
   height: 32px;
-  background: linear-gradient(135deg, {primary_color}, {secondary_color});
+  background: linear-gradient(135deg, __PRIMARY_COLOR__, __SECONDARY_COLOR__);
   border: 1px solid rgba(255, 255, 255, 0.3);
-}}
+}
 
-.cube-front  {{ transform: rotateY(  0deg) translateZ(16px); }}
-.cube-back   {{ transform: rotateY(180deg) translateZ(16px); }}
-.cube-right  {{ transform: rotateY( 90deg) translateZ(16px); }}
-.cube-left   {{ transform: rotateY(-90deg) translateZ(16px); }}
-.cube-top    {{ transform: rotateX( 90deg) translateZ(16px); }}
-.cube-bottom {{ transform: rotateX(-90deg) translateZ(16px); }}
+.cube-front  { transform: rotateY(  0deg) translateZ(16px); }
+.cube-back   { transform: rotateY(180deg) translateZ(16px); }
+.cube-right  { transform: rotateY( 90deg) translateZ(16px); }
+.cube-left   { transform: rotateY(-90deg) translateZ(16px); }
+.cube-top    { transform: rotateX( 90deg) translateZ(16px); }
+.cube-bottom { transform: rotateX(-90deg) translateZ(16px); }
 
-.logo-text {{
-  font-size: var(--font-size-xl, 1.25rem);
+.logo-text {
+  font-size: clamp(var(--font-size-lg, 1.125rem), 2.5vw, var(--font-size-xl, 1.25rem));
   font-weight: 700;
-  background: linear-gradient(135deg, {primary_color}, {secondary_color});
+  background: linear-gradient(135deg, __PRIMARY_COLOR__, __SECONDARY_COLOR__);
   -webkit-background-clip: text;
   background-clip: text;
   -webkit-text-fill-color: transparent;
   letter-spacing: -0.025em;
-}}
+}
 
-@keyframes rotateCube {{
-  0% {{ transform: rotateX(0deg) rotateY(0deg); }}
-  100% {{ transform: rotateX(360deg) rotateY(360deg); }}
-}}
+@keyframes rotateCube {
+  0% { transform: rotateX(0deg) rotateY(0deg); }
+  100% { transform: rotateX(360deg) rotateY(360deg); }
+}
 
-@media (max-width: 768px) {{
-  .logo-icon {{
+@media (max-width: 768px) {
+  .logo-icon {
     width: 28px;
     height: 28px;
-  }}
+  }
   
-  .cube-face {{
+  .cube-face {
     width: 28px;
     height: 28px;
-  }}
+  }
   
-  .cube-front, .cube-back, .cube-right, .cube-left, .cube-top, .cube-bottom {{
+  .cube-front, .cube-back, .cube-right, .cube-left, .cube-top, .cube-bottom {
     transform-origin: center;
-  }}
-  
-  .cube-front  {{ transform: rotateY(  0deg) translateZ(14px); }}
-  .cube-back   {{ transform: rotateY(180deg) translateZ(14px); }}
-  .cube-right  {{ transform: rotateY( 90deg) translateZ(14px); }}
-  .cube-left   {{ transform: rotateY(-90deg) translateZ(14px); }}
-  .cube-top    {{ transform: rotateX( 90deg) translateZ(14px); }}
-  .cube-bottom {{ transform: rotateX(-90deg) translateZ(14px); }}
+  }
   
-  .logo-text {{
-    font-size: var(--font-size-lg, 1.125rem);
-  }}
-}}'''
+  .cube-front  { transform: rotateY(  0deg) translateZ(14px); }
+  .cube-back   { transform: rotateY(180deg) translateZ(14px); }
+  .cube-right  { transform: rotateY( 90deg) translateZ(14px); }
+  .cube-left   { transform: rotateY(-90deg) translateZ(14px); }
+  .cube-top    { transform: rotateX( 90deg) translateZ(14px); }
+  .cube-bottom { transform: rotateX(-90deg) translateZ(14px); }
+}''', "PRIMARY_COLOR", "SECONDARY_COLOR", "PRIMARY_COLOR", "SECONDARY_COLOR")
+
+@lru_cache(maxsize=128)
+def generate_tech_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
+    """Generate tech-style logo with geometric elements"""
+    
+    logo_jsx = "".join((_TECH_LOGO_JSX[0], company_name, _TECH_LOGO_JSX[1]))
+    
+    logo_css = "".join((
+        _TECH_LOGO_CSS[0], primary_color,
+        _TECH_LOGO_CSS[1], secondary_color,
+        _TECH_LOGO_CSS[2], primary_color,
+        _TECH_LOGO_CSS[3], secondary_color,
+        _TECH_LOGO_CSS[4]
+    ))
     
     return logo_jsx, logo_css
 
-def generate_creative_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
-    """Generate creative logo with artistic elements"""
-    
-    logo_jsx = f'''
-import {{ Link }} from 'react-router-dom';
+_CREATIVE_LOGO_JSX = _split_template('''
+import { Link } from 'react-router-dom';
 import './Logo.css';
 
-export default function Logo() {{
+export default function Logo() {
   return (
     <Link to="/" className="logo-link creative-logo">
       <div className="logo-icon">
         <svg width="32" height="32" viewBox="0 0 32 32" className="logo-svg">
           <defs>
             <linearGradient id="creativeGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-              <stop offset="0%" stopColor="{primary_color}" />
-              <stop offset="100%" stopColor="{secondary_color}" />
+              <stop offset="0%" stopColor="__PRIMARY_COLOR__" />
+              <stop offset="100%" stopColor="__SECONDARY_COLOR__" />
             </linearGradient>
           </defs>
           <circle cx="16" cy="16" r="14" fill="url(#creativeGradient)" className="logo-circle"/>
           <path d="M8 16 L16 8 L24 16 L16 24 Z" fill="white" opacity="0.9" className="logo-diamond"/>
         </svg>
       </div>
-      <span className="logo-text">{company_name}</span>
+      <span className="logo-text">__COMPANY_NAME__</span>
     </Link>
   );
-}}'''
-    
-    logo_css = f'''
-.creative-logo {{
+}''', "PRIMARY_COLOR", "SECONDARY_COLOR", "COMPANY_NAME")
+
+_CREATIVE_LOGO_CSS = _split_css_template('''
+.creative-logo {
   display: inline-flex;
   align-items: center;
   gap: var(--space-sm, 0.5rem);
   text-decoration: none;
   transition: all var(--transition-base, 0.3s ease);
-}}
+}
 
-.creative-logo:hover {{
+.creative-logo:hover {
   transform: scale(1.05);
-}}
+}
 
-.creative-logo:hover .logo-circle {{
+.creative-logo:hover .logo-circle {
   transform: scale(1.1);
-}}
+}
 
-.creative-logo:hover .logo-diamond {{
+.creative-logo:hover .logo-diamond {
   transform: rotate(45deg) scale(1.1);
-}}
+}
 
-.logo-svg {{
+.logo-svg {
   transition: all var(--transition-base, 0.3s ease);
-}}
+}
 
-.logo-circle {{
+.logo-circle {
   transition: transform var(--transition-base, 0.3s ease);
   transform-origin: center;
-}}
+}
 
-.logo-diamond {{
+.logo-diamond {
   transition: transform var(--transition-base, 0.3s ease);
   transform-origin: center;
-}}
+}
 
-.logo-text {{
-  font-size: var(--font-size-xl, 1.25rem);
+.logo-text {
+  font-size: clamp(var(--font-size-lg, 1.125rem), 2.5vw, var(--font-size-xl, 1.25rem));
   font-weight: 700;
-  background: linear-gradient(135deg, {primary_color}, {secondary_color});
+  background: linear-gradient(135deg, __PRIMARY_COLOR__, __SECONDARY_COLOR__);
   -webkit-background-clip: text;
   background-clip: text;
   -webkit-text-fill-color: transparent;
   letter-spacing: -0.025em;
-}}
+}''', "PRIMARY_COLOR", "SECONDARY_COLOR")
 
-@media (max-width: 768px) {{
-  .logo-text {{
-    font-size: var(--font-size-lg, 1.125rem);
-  }}
-}}'''
+@lru_cache(maxsize=128)
+def generate_creative_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
+    """Generate creative logo with artistic elements"""
+    
+    logo_jsx = "".join((
+        _CREATIVE_LOGO_JSX[0], primary_color,
+        _CREATIVE_LOGO_JSX[1], secondary_color,
+        _CREATIVE_LOGO_JSX[2], company_name,
+        _CREATIVE_LOGO_JSX[3]
+    ))
+    
+    logo_css = "".join((
+        _CREATIVE_LOGO_CSS[0], primary_color,
+        _CREATIVE_LOGO_CSS[1], secondary_color,
+        _CREATIVE_LOGO_CSS[2]
+    ))
     
     return logo_jsx, logo_css
 
-def generate_corporate_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
-    """Generate professional corporate logo"""
-    
-    logo_jsx = f'''
-import {{ Link }} from 'react-router-dom';
+_CORPORATE_LOGO_JSX = _split_template('''
+import { Link } from 'react-router-dom';
 import './Logo.css';
 
-export default function Logo() {{
+export default function Logo() {
   return (
     <Link to="/" className="logo-link corporate-logo">
       <div className="logo-icon">
@@ -393,100 +456,106 @@ export default function Logo() {{
           <div className="bar bar-3"></div>
         </div>
       </div>
-      <span className="logo-text">{company_name}</span>
+      <span className="logo-text">__COMPANY_NAME__</span>
     </Link>
   );
-}}'''
-    
-    logo_css = f'''
-.corporate-logo {{
+}''', "COMPANY_NAME")
+
+_CORPORATE_LOGO_CSS = _split_css_template('''
+.corporate-logo {
   display: inline-flex;
   align-items: center;
   gap: var(--space-sm, 0.5rem);
   text-decoration: none;
   transition: all var(--transition-base, 0.3s ease);
-}}
+}
 
-.corporate-logo:hover {{
+.corporate-logo:hover {
   transform: scale(1.05);
-}}
+}
 
-.logo-bars {{
+.logo-bars {
   display: flex;
   align-items: end;
   gap: 3px;
   height: 28px;
-}}
+}
 
-.bar {{
+.bar {
   width: 6px;
-  background: linear-gradient(to top, {primary_color}, {secondary_color});
+  background: linear-gradient(to top, __PRIMARY_COLOR__, __SECONDARY_COLOR__);
   border-radius: 2px;
   transition: all var(--transition-base, 0.3s ease);
-}}
+}
 
-.bar-1 {{
+.bar-1 {
   height: 60%;
   animation: barGrow1 2s ease-in-out infinite;
-}}
+}
 
-.bar-2 {{
+.bar-2 {
   height: 100%;
   animation: barGrow2 2s ease-in-out infinite 0.3s;
-}}
+}
 
-.bar-3 {{
+.bar-3 {
   height: 80%;
   animation: barGrow3 2s ease-in-out infinite 0.6s;
-}}
+}
 
-.corporate-logo:hover .bar {{
+.corporate-logo:hover .bar {
   transform: scaleY(1.1);
-}}
+}
 
-.logo-text {{
-  font-size: var(--font-size-xl, 1.25rem);
+.logo-text {
+  font-size: clamp(var(--font-size-lg, 1.125rem), 2.5vw, var(--font-size-xl, 1.25rem));
   font-weight: 600;
-  color: {primary_color};
+  color: __PRIMARY_COLOR__;
   letter-spacing: 0.025em;
   text-transform: uppercase;
-}}
-
-@keyframes barGrow1 {{
-  0%, 100% {{ height: 60%; }}
-  50% {{ height: 80%; }}
-}}
-
-@keyframes barGrow2 {{
-  0%, 100% {{ height: 100%; }}
-  50% {{ height: 70%; }}
-}}
-
-@keyframes barGrow3 {{
-  0%, 100% {{ height: 80%; }}
-  50% {{ height: 100%; }}
-}}
-
-@media (max-width: 768px) {{
-  .logo-text {{
-    font-size: var(--font-size-lg, 1.125rem);
-  }}
-  
-  .logo-bars {{
+}
+
+@keyframes barGrow1 {
+  0%, 100% { height: 60%; }
+  50% { height: 80%; }
+}
+
+@keyframes barGrow2 {
+  0%, 100% { height: 100%; }
+  50% { height: 70%; }
+}
+
+@keyframes barGrow3 {
+  0%, 100% { height: 80%; }
+  50% { height: 100%; }
+}
+
+@media (max-width: 768px) {
+  .logo-bars {
     height: 24px;
-  }}
-}}'''
+  }
+}''', "PRIMARY_COLOR", "SECONDARY_COLOR", "PRIMARY_COLOR")
+
+@lru_cache(maxsize=128)
+def generate_corporate_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
+    """Generate professional corporate logo"""
+    
+    logo_jsx = "".join((_CORPORATE_LOGO_JSX[0], company_name, _CORPORATE_LOGO_JSX[1]))
+    
+    logo_css = "".join((
+        _CORPORATE_LOGO_CSS[0], primary_color,
+        _CORPORATE_LOGO_CSS[1], secondary_color,
+        _CORPORATE_LOGO_CSS[2], primary_color,
+        _CORPORATE_LOGO_CSS[3]
+    ))
     
     return logo_jsx, logo_css
 
-def generate_modern_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
-    """Generate modern minimalist logo"""
-    
-    logo_jsx = f'''
-import {{ Link }} from 'react-router-dom';
+_MODERN_LOGO_JSX = _split_template('''
+import { Link } from 'react-router-dom';
 import './Logo.css';
 
-export default function Logo() {{
+export default function Logo() {
   return (
     <Link to="/" className="logo-link modern-logo">
       <div className="logo-icon">
@@ -496,115 +565,126 @@ export default function Logo() {{
           <div className="ring ring-center"></div>
         </div>
       </div>
-      <span className="logo-text">{company_name}</span>
+      <span className="logo-text">__COMPANY_NAME__</span>
     </Link>
   );
-}}'''
-    
-    logo_css = f'''
-.modern-logo {{
+}''', "COMPANY_NAME")
+
+_MODERN_LOGO_CSS = _split_css_template('''
+.modern-logo {
   display: inline-flex;
   align-items: center;
   gap: var(--space-sm, 0.5rem);
   text-decoration: none;
   transition: all var(--transition-base, 0.3s ease);
-}}
+}
 
-.modern-logo:hover {{
+.modern-logo:hover {
   transform: scale(1.05);
-}}
+}
 
-.logo-rings {{
+.logo-rings {
   position: relative;
   width: 32px;
   height: 32px;
-}}
+}
 
-.ring {{
+.ring {
   position: absolute;
   border-radius: 50%;
   animation: pulse 3s ease-in-out infinite;
-}}
+}
 
-.ring-outer {{
+.ring-outer {
   width: 32px;
   height: 32px;
-  border: 3px solid {primary_color};
+  border: 3px solid __PRIMARY_COLOR__;
   opacity: 0.6;
   top: 0;
   left: 0;
-}}
+}
 
-.ring-inner {{
+.ring-inner {
   width: 22px;
   height: 22px;
-  border: 2px solid {secondary_color};
+  border: 2px solid __SECONDARY_COLOR__;
   opacity: 0.8;
   top: 5px;
   left: 5px;
   animation-delay: 0.5s;
-}}
+}
 
-.ring-center {{
+.ring-center {
   width: 12px;
   height: 12px;
-  background: linear-gradient(135deg, {primary_color}, {secondary_color});
+  background: linear-gradient(135deg, __PRIMARY_COLOR__, __SECONDARY_COLOR__);
   top: 10px;
   left: 10px;
   animation-delay: 1s;
-}}
+}
 
-.modern-logo:hover .ring {{
+.modern-logo:hover .ring {
   animation-play-state: paused;
   transform: scale(1.1);
-}}
+}
 
-.logo-text {{
-  font-size: var(--font-size-xl, 1.25rem);
+.logo-text {
+  font-size: clamp(var(--font-size-lg, 1.125rem), 2.5vw, var(--font-size-xl, 1.25rem));
   font-weight: 300;
-  color: {primary_color};
+  color: __PRIMARY_COLOR__;
   letter-spacing: 0.05em;
-}}
+}
 
-@keyframes pulse {{
-  0%, 100% {{
+@keyframes pulse {
+  0%, 100% {
     transform: scale(1);
     opacity: 1;
-  }}
-  50% {{
+  }
+  50% {
     transform: scale(1.05);
     opacity: 0.7;
-  }}
-}}
+  }
+}
 
-@media (max-width: 768px) {{
-  .logo-rings {{
+@media (max-width: 768px) {
+  .logo-rings {
     width: 28px;
     height: 28px;
-  }}
+  }
   
-  .ring-outer {{
+  .ring-outer {
     width: 28px;
     height: 28px;
-  }}
+  }
   
-  .ring-inner {{
+  .ring-inner {
     width: 18px;
     height: 18px;
     top: 5px;
     left: 5px;
-  }}
+  }
   
-  .ring-center {{
+  .ring-center {
     width: 10px;
     height: 10px;
     top: 9px;
     left: 9px;
-  }}
-  
-  .logo-text {{
-    font-size: var(--font-size-lg, 1.125rem);
-  }}
-}}'''
+  }
+}''', "PRIMARY_COLOR", "SECONDARY_COLOR", "PRIMARY_COLOR", "SECONDARY_COLOR", "PRIMARY_COLOR")
+
+@lru_cache(maxsize=128)
+def generate_modern_logo(company_name: str, primary_color: str, secondary_color: str) -> tuple:
+    """Generate modern minimalist logo"""
     
-    return logo_jsx, logo_css
\ No newline at end of file
+    logo_jsx = "".join((_MODERN_LOGO_JSX[0], company_name, _MODERN_LOGO_JSX[1]))
+    
+    logo_css = "".join((
+        _MODERN_LOGO_CSS[0], primary_color,
+        _MODERN_LOGO_CSS[1], secondary_color,
+        _MODERN_LOGO_CSS[2], primary_color,
+        _MODERN_LOGO_CSS[3], secondary_color,
+        _MODERN_LOGO_CSS[4], primary_color,
+        _MODERN_LOGO_CSS[5]
+    ))
+    
+    return logo_jsx, logo_css
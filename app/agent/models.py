@@ -1,12 +1,5 @@
 from typing import TypedDict, List, Optional
 from pydantic import BaseModel
-import os
-from groq import Groq
-from dotenv import load_dotenv
-
-load_dotenv()
-groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-MODEL_NAME = "llama-3.1-70b-versatile"
 
 class AgentState(TypedDict):
     website_desc: str
@@ -25,7 +18,7 @@ class AgentState(TypedDict):
     component_css: dict[str, str]
     pages: dict[str, str]
     page_css: dict[str, str]
-    react_project: dict[str, dict[str, str]]
+    react_project: dict[str, bytes]
     zip_path: str | None
 
 class NavLink(BaseModel):
@@ -1,175 +1,143 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from .models import AgentState
-from .code_utils import extract_code_and_css, clean_imports
+from .code_utils import extract_code_and_css
 from .css_utils import clean_css
-from .llm_utils import groq_client, MODEL_NAME
+from .llm_utils import LLMError, cached_completion
 
-def generate_landing_page(state: AgentState) -> AgentState:
-    """Generate Landing Page using advanced Bootstrap and custom CSS"""
-    components = ["Navbar", "Hero", "Features", "Pricing", "Testimonials", "FAQ", "Newsletter", "Footer", "ContactButton", "Logo"]
-    desc = state["landing_desc"]
-    primary_color = state.get("primary_color", "#0d6efd")
-    secondary_color = state.get("secondary_color", "#6610f2")
-    logo_url = state.get("logo_url", "")
-    nav_links = state.get("nav_links", [])
-    features = state.get("features", [])
-    pricing = state.get("pricing", [])
-    testimonials = state.get("testimonials", [])
-    faqs = state.get("faqs", [])
+logger = logging.getLogger(__name__)
+
+# Output rules shared by every page prompt, sent as a byte-identical system
+# message so the provider can reuse the prefix across the three calls
+_PAGE_RULES = (
+    "RULES: className, never class; apply both colors consistently; "
+    "valid CSS (selector { property: value; }, every property ends with ';', no ',;'); "
+    "Bootstrap 5 for styling; No FontAwesome dependencies - use Bootstrap Icons only; "
+    "besides react / react-router-dom, import only the page CSS and '../components/ComponentName'; "
+    "no local images; navigate with Link from 'react-router-dom'; responsive, accessible, animated.\n"
+    "Return only two code blocks: the JSX page, then ```css. No explanations or comments.\n"
+    "Keep the code compact: 2-space indentation, no blank lines, one statement or CSS declaration per line."
+)
+
+# Reply token cap shared by every page. Streaming already stops at the end of
+# the CSS block, so this only bounds runaway replies. Per-page caps would need
+# measured reply sizes, and a cap set too low cuts off the CSS block.
+_PAGE_MAX_TOKENS = 3000
+
+# Page briefs, filled in per request with str.format
+_LANDING_PROMPT = (
+    "Build a modern, highly interactive React landing page with a premium SaaS look "
+    "(gradients, glassmorphism, cards, shadows, carousels, modals).\n"
+    "Description: {desc}\n"
+    "Colors: primary {primary_color}, secondary {secondary_color}\n"
+    "{sections}"
+    "Components: Navbar, Hero, Features, Pricing, Testimonials, FAQ, Newsletter, Footer, ContactButton "
+    "in that order, plus Logo; pass them props and theming.\n"
+    "Section ids for smooth scrolling: hero, features, pricing, testimonials, faq, newsletter.\n"
+    "Use hooks (useState, useEffect, useNavigate) for interactivity, scroll animations and CSS-only particle effects.\n"
+    "Link to /main and /checkout. The JSX starts with import './Landing.css';"
+)
+
+_MAIN_PROMPT = (
+    "Build a professional, interactive React product page.\n"
+    "Description: {desc}\n"
+    "Colors: primary {primary_color}, secondary {secondary_color}\n"
+    "Components: Navbar, Sidebar, Features, Pricing, Footer, ContactButton, Logo.\n"
+    "Show at least 8 product/feature cards with hover effects and modal previews, "
+    "and a working sidebar with navigation, search and filters.\n"
+    "Use hooks (useState, useEffect, useNavigate) for state, loading states and animations.\n"
+    "Link to / and /checkout. The JSX starts with import './Main.css';"
+)
+
+_CHECKOUT_PROMPT = (
+    "Build a professional, secure React checkout page.\n"
+    "Description: {desc}\n"
+    "Colors: primary {primary_color}, secondary {secondary_color}\n"
+    "{sections}"
+    "Components: Navbar, Footer, ContactButton, Logo.\n"
+    "Multi-step form: plan selection, personal info, payment details, confirmation; "
+    "with validation, loading states, an order summary, trust badges and security indicators.\n"
+    "Use hooks (useState, useEffect, useNavigate) for form state and validation.\n"
+    "Link to / and /main. The JSX starts with import './Checkout.css';"
+)
 
+# Optional prompt sections as (label, state key); empty values are left out
+_LANDING_SECTIONS = (
+    ("Logo URL", "logo_url"),
+    ("Navigation links", "nav_links"),
+    ("Features", "features"),
+    ("Pricing", "pricing"),
+    ("Testimonials", "testimonials"),
+    ("FAQs", "faqs"),
+)
+_CHECKOUT_SECTIONS = (("Pricing plans", "pricing"),)
+
+def _prompt_sections(state: AgentState, sections) -> str:
+    """Render one "Label: value" line per non-empty state value"""
+    return "".join(f"{label}: {state[key]}\n" for label, key in sections if state.get(key))
+
+def _generate_page(state: AgentState, *, key: str, prompt: str, fallback_page, fallback_css) -> tuple[str, str, str]:
+    """Generate one page from its prompt; returns (key, jsx, css), the fallback if the LLM call fails"""
     try:
-        response = groq_client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{
-                "role": "user",
-                "content": (
-                    f"Create a visually stunning, highly interactive, and modern React landing page using components {', '.join(components)}. "
-                    f"Description: {desc}. Use advanced Bootstrap 5 classes, gradients, glassmorphism, cards, shadows, carousels, modals, and color utilities for a premium SaaS experience. "
-                    f"Theme the entire page using the primary color {primary_color} and secondary color {secondary_color} consistently throughout all sections. "
-                    f"Logo URL: {logo_url}. Navigation links: {nav_links}. Features: {features}. Pricing: {pricing}. Testimonials: {testimonials}. FAQs: {faqs}. "
-                    "Arrange components in this order: Navbar, Hero, Features, Pricing, Testimonials, FAQ, Newsletter, Footer, ContactButton. "
-                    "Add section IDs for smooth scrolling: hero, features, pricing, testimonials, faq, newsletter. "
-                    "Include scroll animations, particle effects (CSS only), interactive elements, and modern design patterns. "
-                    "Use proper React Router Link components for navigation. Import { Link } from 'react-router-dom'. "
-                    "Add React hooks (useState, useEffect, useNavigate) for interactivity, smooth scrolling, and dynamic content. "
-                    "Include navigation buttons that link to /main and /checkout pages. "
-                    "Return two code blocks: one with the React page (JSX, import './Landing.css'; at the top), and one with the CSS (in ```css code block). "
-                    "Import all components from '../components/ComponentName', example: import Navbar from '../components/Navbar'. "
-                    "Render all imported components with proper props and theming. "
-                    "CRITICAL REQUIREMENTS:\n"
-                    "- Use 'className' instead of 'class' for ALL HTML attributes\n"
-                    "- Apply the primary and secondary colors consistently throughout\n"
-                    "- Ensure all CSS syntax is valid and error-free\n"
-                    "- CSS selectors must end with space then {{ not semicolon\n"
-                    "- CSS properties must end with semicolon\n"
-                    "- No comma-semicolon combinations like ',;'\n"
-                    "- Use proper CSS syntax: selector {{ property: value; }}\n"
-                    "- No FontAwesome dependencies - use Bootstrap Icons only\n"
-                    "- Do NOT import any CSS files or external libraries except component CSS\n"
-                    "- Do NOT reference local image files\n"
-                    "- Add smooth animations and interactive elements\n"
-                    "- Make it responsive and accessible\n"
-                    "- Use React Router for navigation between pages\n"
-                    "- No explanations, no markdown, no comments, no extra text."
-                )
-            }],
+        content = cached_completion(
+            prompt,
+            system=_PAGE_RULES,
             temperature=0.3,
-            max_tokens=3000
+            max_tokens=_PAGE_MAX_TOKENS,
+            stop_after_blocks=2
         )
         
-        js_code, css_code = extract_code_and_css(response.choices[0].message.content)
-        state.setdefault("pages", {})["Landing"] = clean_imports(js_code)
-        state.setdefault("page_css", {})["Landing"] = clean_css(css_code)
-        print("✅ Landing page generated successfully")
+        js_code, css_code = extract_code_and_css(content)
+        css_code = clean_css(css_code)
+        logger.info("%s page generated", key)
         
-    except Exception as e:
-        print(f"❌ Error generating landing page: {e}")
-        # Add fallback landing page
-        state.setdefault("pages", {})["Landing"] = get_fallback_landing_page(state)
-        state.setdefault("page_css", {})["Landing"] = get_fallback_landing_css(state)
+    # Only LLM failures fall back; anything else is a bug and should surface
+    except LLMError:
+        logger.exception("%s page generation failed, using fallback page", key)
+        js_code, css_code = fallback_page(state), fallback_css(state)
     
+    return key, js_code, css_code
+
+def _skip_page(state: AgentState, *, key: str, fallback_page, fallback_css) -> tuple[str, str, str]:
+    """Use the fallback page without an LLM call when its description is missing or blank"""
+    logger.warning("No %s description, using fallback page", key.lower())
+    return key, fallback_page(state), fallback_css(state)
+
+def _store_page(state: AgentState, key: str, js_code: str, css_code: str) -> AgentState:
+    """Store one generated page and its CSS on the state"""
+    state.setdefault("pages", {})[key] = js_code
+    state.setdefault("page_css", {})[key] = css_code
     return state
 
+def _build_page(state: AgentState, key: str) -> tuple[str, str, str]:
+    """Build one page's prompt from its spec and generate it; returns (key, jsx, css)"""
+    desc_key, template, sections, fallback_page, fallback_css = _PAGE_SPECS[key]
+    desc = state.get(desc_key) or ""
+    if not desc.strip():
+        return _skip_page(state, key=key, fallback_page=fallback_page, fallback_css=fallback_css)
+    
+    prompt = template.format(
+        desc=desc,
+        primary_color=state.get("primary_color", "#0d6efd"),
+        secondary_color=state.get("secondary_color", "#6610f2"),
+        sections=_prompt_sections(state, sections)
+    )
+    return _generate_page(state, key=key, prompt=prompt, fallback_page=fallback_page, fallback_css=fallback_css)
+
+def generate_landing_page(state: AgentState) -> AgentState:
+    """Generate Landing Page using advanced Bootstrap and custom CSS"""
+    return _store_page(state, *_build_page(state, "Landing"))
+
 def generate_main_page(state: AgentState) -> AgentState:
     """Generate Main Page using advanced Bootstrap and custom CSS"""
-    components = ["Navbar", "Sidebar", "Features", "Pricing", "Footer", "ContactButton", "Logo"]
-    desc = state["main_desc"]
-    primary_color = state.get("primary_color", "#0d6efd")
-    secondary_color = state.get("secondary_color", "#6610f2")
-    
-    try:
-        response = groq_client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{
-                "role": "user",
-                "content": (
-                    f"Create a professional, interactive React main page using components {', '.join(components)}. "
-                    f"Description: {desc}. Use advanced Bootstrap 5 classes, cards, badges, gradients, and color utilities for a beautiful product showcase. "
-                    f"Theme the page using primary color {primary_color} and secondary color {secondary_color} consistently. "
-                    "Add at least 8 product/feature cards with hover effects, modal previews, and interactive elements. "
-                    "Include a functional sidebar with navigation, search, and filters. "
-                    "Add animations, loading states, and modern UI patterns. "
-                    "Use React hooks (useState, useEffect, useNavigate) for state management and interactivity. "
-                    "Include navigation buttons that link back to / (home) and to /checkout. "
-                    "Use React Router Link for all navigation: import { Link } from 'react-router-dom'. "
-                    "Return two code blocks: one with the React page (JSX, import './Main.css'; at the top), and one with CSS. "
-                    "Import all components from '../components/ComponentName'. "
-                    "CRITICAL: Apply consistent theming, use Bootstrap Icons only, no local image files, add interactivity. "
-                    "Use React Router for navigation between pages. "
-                    "No explanations, no markdown, no comments, no extra text."
-                )
-            }],
-            temperature=0.3,
-            max_tokens=3000
-        )
-        
-        js_code, css_code = extract_code_and_css(response.choices[0].message.content)
-        state.setdefault("pages", {})["Main"] = clean_imports(js_code)
-        state.setdefault("page_css", {})["Main"] = clean_css(css_code)
-        print("✅ Main page generated successfully")
-        
-    except Exception as e:
-        print(f"❌ Error generating main page: {e}")
-        # Add fallback main page
-        state.setdefault("pages", {})["Main"] = get_fallback_main_page(state)
-        state.setdefault("page_css", {})["Main"] = get_fallback_main_css(state)
-    
-    return state
+    return _store_page(state, *_build_page(state, "Main"))
 
 def generate_checkout_page(state: AgentState) -> AgentState:
     """Generate Checkout Page using advanced Bootstrap and custom CSS"""
-    components = ["Navbar", "Footer", "ContactButton", "Logo"]
-    desc = state["checkout_desc"]
-    primary_color = state.get("primary_color", "#0d6efd")
-    secondary_color = state.get("secondary_color", "#6610f2")
-    pricing = state.get("pricing", [])
-    
-    try:
-        response = groq_client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{
-                "role": "user",
-                "content": (
-                    f"Create a professional, secure React checkout page using components {', '.join(components)}. "
-                    f"Description: {desc}. Use advanced Bootstrap 5 classes, forms, cards, progress bars, and validation for a premium checkout experience. "
-                    f"Theme the page using primary color {primary_color} and secondary color {secondary_color} consistently. "
-                    f"Include pricing plans: {pricing}. "
-                    "Add a multi-step checkout form with: plan selection, personal info, payment details, and confirmation. "
-                    "Include form validation, loading states, secure payment UI, and order summary. "
-                    "Add trust badges, security indicators, and professional styling. "
-                    "Use React hooks (useState, useEffect, useNavigate) for form state and validation. "
-                    "Include navigation buttons that link back to / (home) and /main. "
-                    "Use React Router Link for navigation: import { Link } from 'react-router-dom'. "
-                    "Return two code blocks: one with the React page (JSX, import './Checkout.css'; at the top), and one with CSS. "
-                    "Import all components from '../components/ComponentName'. "
-                    "CRITICAL: Apply consistent theming, use Bootstrap Icons only, no local image files, add form validation. "
-                    "Use React Router for navigation between pages. "
-                    "No explanations, no markdown, no comments, no extra text."
-                )
-            }],
-            temperature=0.3,
-            max_tokens=3000
-        )
-        
-        js_code, css_code = extract_code_and_css(response.choices[0].message.content)
-        state.setdefault("pages", {})["Checkout"] = clean_imports(js_code)
-        state.setdefault("page_css", {})["Checkout"] = clean_css(css_code)
-        print("✅ Checkout page generated successfully")
-        
-    except Exception as e:
-        print(f"❌ Error generating checkout page: {e}")
-        # Add fallback checkout page
-        state.setdefault("pages", {})["Checkout"] = get_fallback_checkout_page(state)
-        state.setdefault("page_css", {})["Checkout"] = get_fallback_checkout_css(state)
-    
-    return state
+    return _store_page(state, *_build_page(state, "Checkout"))
 
-def get_fallback_landing_page(state: AgentState) -> str:
-    """Fallback landing page if LLM generation fails"""
-    primary_color = state.get("primary_color", "#4f46e5")
-    secondary_color = state.get("secondary_color", "#06b6d4")
-    
-    return f"""import React from 'react';
-import {{ Link }} from 'react-router-dom';
+_FALLBACK_LANDING_PAGE = """import React from 'react';
+import { Link } from 'react-router-dom';
 import Navbar from '../components/Navbar';
 import Hero from '../components/Hero';
 import Features from '../components/Features';
@@ -179,7 +147,7 @@ import FAQ from '../components/FAQ';
 import Footer from '../components/Footer';
 import './Landing.css';
 
-export default function Landing() {{
+export default function Landing() {
   return (
     <div className="landing-page">
       <Navbar />
@@ -191,7 +159,11 @@ export default function Landing() {{
       <Footer />
     </div>
   );
-}}"""
+}"""
+
+def get_fallback_landing_page(state: AgentState) -> str:
+    """Fallback landing page if LLM generation fails"""
+    return _FALLBACK_LANDING_PAGE
 
 def get_fallback_landing_css(state: AgentState) -> str:
     """Fallback landing CSS if LLM generation fails"""
@@ -216,9 +188,7 @@ def get_fallback_landing_css(state: AgentState) -> str:
   color: white;
 }}"""
 
-def get_fallback_main_page(state: AgentState) -> str:
-    """Fallback main page if LLM generation fails"""
-    return """import React from 'react';
+_FALLBACK_MAIN_PAGE = """import React from 'react';
 import { Link } from 'react-router-dom';
 import Navbar from '../components/Navbar';
 import Sidebar from '../components/Sidebar';
@@ -245,6 +215,10 @@ export default function Main() {
   );
 }"""
 
+def get_fallback_main_page(state: AgentState) -> str:
+    """Fallback main page if LLM generation fails"""
+    return _FALLBACK_MAIN_PAGE
+
 def get_fallback_main_css(state: AgentState) -> str:
     """Fallback main CSS if LLM generation fails"""
     primary_color = state.get("primary_color", "#4f46e5")
@@ -260,9 +234,7 @@ def get_fallback_main_css(state: AgentState) -> str:
   min-height: calc(100vh - 76px);
 }}"""
 
-def get_fallback_checkout_page(state: AgentState) -> str:
-    """Fallback checkout page if LLM generation fails"""
-    return """import React, { useState } from 'react';
+_FALLBACK_CHECKOUT_PAGE = """import React, { useState } from 'react';
 import { Link } from 'react-router-dom';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
@@ -301,6 +273,10 @@ export default function Checkout() {
   );
 }"""
 
+def get_fallback_checkout_page(state: AgentState) -> str:
+    """Fallback checkout page if LLM generation fails"""
+    return _FALLBACK_CHECKOUT_PAGE
+
 def get_fallback_checkout_css(state: AgentState) -> str:
     """Fallback checkout CSS if LLM generation fails"""
     primary_color = state.get("primary_color", "#4f46e5")
@@ -323,14 +299,29 @@ def get_fallback_checkout_css(state: AgentState) -> str:
   border-radius: 0.5rem;
 }}"""
 
+# Pages in project order, as key -> (description state key, prompt template,
+# optional prompt sections, fallback page, fallback CSS)
+_PAGE_SPECS = {
+    "Landing": ("landing_desc", _LANDING_PROMPT, _LANDING_SECTIONS, get_fallback_landing_page, get_fallback_landing_css),
+    "Main": ("main_desc", _MAIN_PROMPT, (), get_fallback_main_page, get_fallback_main_css),
+    "Checkout": ("checkout_desc", _CHECKOUT_PROMPT, _CHECKOUT_SECTIONS, get_fallback_checkout_page, get_fallback_checkout_css),
+}
+
 def generate_pages(state: AgentState) -> AgentState:
     """Generate all pages"""
-    print("🔄 Starting page generation...")
+    logger.info("Starting page generation")
+    
+    pages = state.setdefault("pages", {})
+    page_css = state.setdefault("page_css", {})
     
-    # Generate each page
-    state = generate_landing_page(state)
-    state = generate_main_page(state)
-    state = generate_checkout_page(state)
+    # Generate pages concurrently; each LLM call is independent and network-bound.
+    # Workers only read the state and return (key, jsx, css), so the threads
+    # never write shared dicts; results are stored here in spec order.
+    with ThreadPoolExecutor(max_workers=len(_PAGE_SPECS)) as executor:
+        results = executor.map(lambda key: _build_page(state, key), _PAGE_SPECS)
+        for key, js_code, css_code in results:
+            pages[key] = js_code
+            page_css[key] = css_code
     
-    print(f"📄 Generated {len(state.get('pages', {}))} pages total")
+    logger.info("Generated %d pages total", len(pages))
     return state
\ No newline at end of file
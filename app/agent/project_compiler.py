@@ -1,34 +1,18 @@
+import contextlib
 import json
+import logging
 import zipfile
 import os
-from pathlib import Path
+import re
+import tempfile
+import time
+from functools import lru_cache
 from .models import AgentState
 
-def compile_project(state: AgentState) -> AgentState:
-    """Create complete React project structure with Bootstrap and per-file CSS"""
-    
-    # Debug: Print what components were generated
-    print(f"🔍 Compiling project with {len(state.get('components', {}))} components:")
-    for name in state.get('components', {}):
-        print(f"   - {name}")
-    
-    # Get theme colors for global CSS
-    primary_color = state.get("primary_color", "#4f46e5")
-    secondary_color = state.get("secondary_color", "#06b6d4")
-    
-    state["react_project"] = {
-        "src": {
-            "components": {
-                # Add ALL generated components (both .jsx and .css files)
-                **{f"{name}.jsx": code for name, code in state.get("components", {}).items()},
-                **{f"{name}.css": css for name, css in state.get("component_css", {}).items()}
-            },
-            "pages": {
-                # Add ALL generated pages (both .jsx and .css files)
-                **{f"{name}.jsx": code for name, code in state.get("pages", {}).items()},
-                **{f"{name}.css": css for name, css in state.get("page_css", {}).items()}
-            },
-            "App.jsx": """import { BrowserRouter, Routes, Route } from 'react-router-dom';
+logger = logging.getLogger(__name__)
+
+# Project files that do not depend on the generated content or theme
+_APP_JSX = """import { BrowserRouter, Routes, Route } from 'react-router-dom';
 import Landing from './pages/Landing';
 import Main from './pages/Main';
 import Checkout from './pages/Checkout';
@@ -43,8 +27,9 @@ export default function App() {
       </Routes>
     </BrowserRouter>
   );
-}""",
-            "index.js": """import React from 'react';
+}"""
+
+_INDEX_JS = """import React from 'react';
 import ReactDOM from 'react-dom/client';
 import App from './App';
 import './index.css';
@@ -54,8 +39,177 @@ root.render(
   <React.StrictMode>
     <App />
   </React.StrictMode>
-);""",
-            "index.css": f"""/* Global styles with theme colors */
+);"""
+
+_ROBOTS_TXT = """# https://www.robotstxt.org/robotstxt.html
+User-agent: *
+Disallow: /admin/
+Disallow: /private/
+Allow: /
+
+# Sitemap
+Sitemap: /sitemap.xml"""
+
+_GITIGNORE = """# See https://help.github.com/articles/ignoring-files/ for more about ignoring files.
+
+# dependencies
+/node_modules
+/.pnp
+.pnp.js
+
+# testing
+/coverage
+
+# production
+/build
+
+# misc
+.DS_Store
+.env
+.env.local
+.env.development.local
+.env.test.local
+.env.production.local
+
+# logs
+npm-debug.log*
+yarn-debug.log*
+yarn-error.log*
+lerna-debug.log*
+
+# Runtime data
+pids
+*.pid
+*.seed
+*.pid.lock
+
+# IDE files
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
+
+# OS generated files
+.DS_Store
+.DS_Store?
+._*
+.Spotlight-V100
+.Trashes
+ehthumbs.db
+Thumbs.db"""
+
+# JSON files serialized once at import; the manifest's theme color is spliced
+# in per project in place of its "__THEME_COLOR__" placeholder
+_PACKAGE_JSON = json.dumps({
+    "name": "generated-react-website",
+    "version": "0.1.0",
+    "private": True,
+    "description": "Professional React website generated automatically",
+    "keywords": ["react", "website", "bootstrap", "responsive"],
+    "author": "AI Website Generator",
+    "license": "MIT",
+    "dependencies": {
+        "@testing-library/jest-dom": "^5.16.5",
+        "@testing-library/react": "^13.4.0",
+        "@testing-library/user-event": "^13.5.0",
+        "react": "^18.2.0",
+        "react-dom": "^18.2.0",
+        "react-router-dom": "^6.8.1",
+        "react-scripts": "5.0.1",
+        "web-vitals": "^2.1.4",
+        "bootstrap": "^5.3.2"
+    },
+    "scripts": {
+        "start": "react-scripts start",
+        "build": "react-scripts build",
+        "test": "react-scripts test",
+        "eject": "react-scripts eject",
+        "analyze": "npm run build && npx source-map-explorer 'build/static/js/*.js'",
+        "lint": "eslint src --ext .js,.jsx,.ts,.tsx",
+        "format": "prettier --write src"
+    },
+    "eslintConfig": {
+        "extends": [
+            "react-app",
+            "react-app/jest"
+        ]
+    },
+    "browserslist": {
+        "production": [
+            ">0.2%",
+            "not dead",
+            "not op_mini all"
+        ],
+        "development": [
+            "last 1 chrome version",
+            "last 1 firefox version",
+            "last 1 safari version"
+        ]
+    },
+    "engines": {
+        "node": ">=16.0.0",
+        "npm": ">=8.0.0"
+    }
+}, indent=2)
+
+_MANIFEST_JSON = json.dumps({
+    "short_name": "React App",
+    "name": "Generated React Website",
+    "icons": [
+        {
+            "src": "favicon.ico",
+            "sizes": "64x64 32x32 24x24 16x16",
+            "type": "image/x-icon"
+        },
+        {
+            "src": "logo192.png",
+            "type": "image/png",
+            "sizes": "192x192"
+        },
+        {
+            "src": "logo512.png",
+            "type": "image/png", 
+            "sizes": "512x512"
+        }
+    ],
+    "start_url": ".",
+    "display": "standalone",
+    "theme_color": "__THEME_COLOR__",
+    "background_color": "#ffffff",
+    "orientation": "portrait-primary"
+}, indent=2)
+
+# Generated sources are text that deflates well at the fastest level; files
+# too small to gain from deflate are stored as-is
+_ZIP_COMPRESSLEVEL = 1
+_ZIP_STORE_BELOW = 200
+_ZIP_BUFFER_SIZE = 1 << 20
+
+@lru_cache(maxsize=32)
+def _build_project(primary_color: str, secondary_color: str, components: tuple, component_css: tuple,
+                   pages: tuple, page_css: tuple) -> dict[str, bytes]:
+    """Build the flat {path: UTF-8 content} project files; cached, so the result is shared and must not be mutated"""
+    # README bullet lists; built up front as f-string expressions cannot hold "\n" before 3.12
+    component_list = "\n".join(f"- **{name}** - Professional component with CSS animations and interactions" for name, _ in components)
+    page_list = "\n".join(f"- **{name}** - Responsive page with modern design patterns" for name, _ in pages)
+    
+    # Add ALL generated components and pages (both .jsx and .css files),
+    # inserting straight into one dict rather than merging temporary ones
+    files = {}
+    for name, code in components:
+        files[f"src/components/{name}.jsx"] = code
+    for name, css in component_css:
+        files[f"src/components/{name}.css"] = css
+    for name, code in pages:
+        files[f"src/pages/{name}.jsx"] = code
+    for name, css in page_css:
+        files[f"src/pages/{name}.css"] = css
+    
+    files.update({
+        "src/App.jsx": _APP_JSX,
+        "src/index.js": _INDEX_JS,
+        "src/index.css": f"""/* Global styles with theme colors */
 body {{
   margin: 0;
   font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen',
@@ -395,10 +549,8 @@ code {{
   .footer {{
     display: none !important;
   }}
-}}"""
-        },
-        "public": {
-            "index.html": f"""<!DOCTYPE html>
+}}""",
+        "public/index.html": f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -453,143 +605,13 @@ code {{
   <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js" integrity="sha384-C6RzsynM9kWDrMNeT87bh95OGNyZPhcTNXj1NW7RuBCsyN/o0jlpcV8Qyq46cDfL" crossorigin="anonymous"></script>
 </body>
 </html>""",
-            "favicon.ico": "",
-            "logo192.png": "",
-            "logo512.png": "",
-            "robots.txt": """# https://www.robotstxt.org/robotstxt.html
-User-agent: *
-Disallow: /admin/
-Disallow: /private/
-Allow: /
-
-# Sitemap
-Sitemap: /sitemap.xml""",
-            "manifest.json": json.dumps({
-                "short_name": "React App",
-                "name": "Generated React Website",
-                "icons": [
-                    {
-                        "src": "favicon.ico",
-                        "sizes": "64x64 32x32 24x24 16x16",
-                        "type": "image/x-icon"
-                    },
-                    {
-                        "src": "logo192.png",
-                        "type": "image/png",
-                        "sizes": "192x192"
-                    },
-                    {
-                        "src": "logo512.png",
-                        "type": "image/png", 
-                        "sizes": "512x512"
-                    }
-                ],
-                "start_url": ".",
-                "display": "standalone",
-                "theme_color": primary_color,
-                "background_color": "#ffffff",
-                "orientation": "portrait-primary"
-            }, indent=2)
-        },
-        "package.json": json.dumps({
-            "name": "generated-react-website",
-            "version": "0.1.0",
-            "private": True,
-            "description": "Professional React website generated automatically",
-            "keywords": ["react", "website", "bootstrap", "responsive"],
-            "author": "AI Website Generator",
-            "license": "MIT",
-            "dependencies": {
-                "@testing-library/jest-dom": "^5.16.5",
-                "@testing-library/react": "^13.4.0",
-                "@testing-library/user-event": "^13.5.0",
-                "react": "^18.2.0",
-                "react-dom": "^18.2.0",
-                "react-router-dom": "^6.8.1",
-                "react-scripts": "5.0.1",
-                "web-vitals": "^2.1.4",
-                "bootstrap": "^5.3.2"
-            },
-            "scripts": {
-                "start": "react-scripts start",
-                "build": "react-scripts build",
-                "test": "react-scripts test",
-                "eject": "react-scripts eject",
-                "analyze": "npm run build && npx source-map-explorer 'build/static/js/*.js'",
-                "lint": "eslint src --ext .js,.jsx,.ts,.tsx",
-                "format": "prettier --write src"
-            },
-            "eslintConfig": {
-                "extends": [
-                    "react-app",
-                    "react-app/jest"
-                ]
-            },
-            "browserslist": {
-                "production": [
-                    ">0.2%",
-                    "not dead",
-                    "not op_mini all"
-                ],
-                "development": [
-                    "last 1 chrome version",
-                    "last 1 firefox version",
-                    "last 1 safari version"
-                ]
-            },
-            "engines": {
-                "node": ">=16.0.0",
-                "npm": ">=8.0.0"
-            }
-        }, indent=2),
-        ".gitignore": """# See https://help.github.com/articles/ignoring-files/ for more about ignoring files.
-
-# dependencies
-/node_modules
-/.pnp
-.pnp.js
-
-# testing
-/coverage
-
-# production
-/build
-
-# misc
-.DS_Store
-.env
-.env.local
-.env.development.local
-.env.test.local
-.env.production.local
-
-# logs
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-lerna-debug.log*
-
-# Runtime data
-pids
-*.pid
-*.seed
-*.pid.lock
-
-# IDE files
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# OS generated files
-.DS_Store
-.DS_Store?
-._*
-.Spotlight-V100
-.Trashes
-ehthumbs.db
-Thumbs.db""",
+        "public/favicon.ico": "",
+        "public/logo192.png": "",
+        "public/logo512.png": "",
+        "public/robots.txt": _ROBOTS_TXT,
+        "public/manifest.json": _MANIFEST_JSON.replace('"__THEME_COLOR__"', json.dumps(primary_color)),
+        "package.json": _PACKAGE_JSON,
+        ".gitignore": _GITIGNORE,
         "README.md": f"""# Generated React Website
 
 This professional React website was generated automatically using AI and includes modern design patterns, responsive layout, and production-ready features.
@@ -614,11 +636,11 @@ This professional React website was generated automatically using AI and include
 
 ## 📦 Generated Components
 
-{chr(10).join([f'- **{name}** - Professional component with CSS animations and interactions' for name in state.get('components', {}).keys()])}
+{component_list}
 
 ## 📄 Generated Pages
 
-{chr(10).join([f'- **{name}** - Responsive page with modern design patterns' for name in state.get('pages', {}).keys()])}
+{page_list}
 
 ## 🚀 Quick Start
 
@@ -656,14 +678,14 @@ This professional React website was generated automatically using AI and include
 
 ```
 src/
-├── components/          # {len(state.get('components', {}))} Reusable UI components
+├── components/          # {len(components)} Reusable UI components
 │   ├── Navbar.jsx      # Navigation component
 │   ├── Hero.jsx        # Hero section
 │   ├── Features.jsx    # Features showcase
 │   ├── Pricing.jsx     # Pricing cards
 │   ├── Footer.jsx      # Site footer
 │   └── *.css          # Component-specific styles
-├── pages/              # {len(state.get('pages', {}))} Page components
+├── pages/              # {len(pages)} Page components
 │   ├── Landing.jsx     # Landing/home page
 │   ├── Main.jsx        # Main/features page
 │   ├── Checkout.jsx    # Checkout/pricing page
@@ -754,13 +776,40 @@ Generated with ❤️ by **AI Website Generator**
 
 **Enjoy your new professional React website!** 🎉
 """
-    }
+    })
     
-    # Debug: Print final project structure
-    print(f"📁 Final project structure:")
-    print(f"   Components: {len(state['react_project']['src']['components'])} files")
-    print(f"   Pages: {len(state['react_project']['src']['pages'])} files")
-    print(f"   Public files: {len(state['react_project']['public'])} files")
+    # Encode once here, inside the cache, rather than per entry in writestr
+    return {path: content.encode() for path, content in files.items()}
+
+def compile_project(state: AgentState) -> AgentState:
+    """Create complete React project structure with Bootstrap and per-file CSS"""
+    
+    components = state.get("components", {})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Compiling project with %d components: %s", len(components), ", ".join(components))
+    
+    # Get theme colors for global CSS
+    primary_color = state.get("primary_color", "#4f46e5")
+    secondary_color = state.get("secondary_color", "#06b6d4")
+    
+    # Identical inputs, e.g. a regenerate served from cached LLM replies,
+    # reuse the files built last time
+    state["react_project"] = _build_project(
+        primary_color, secondary_color,
+        tuple(components.items()),
+        tuple(state.get("component_css", {}).items()),
+        tuple(state.get("pages", {}).items()),
+        tuple(state.get("page_css", {}).items())
+    )
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        project = state["react_project"]
+        logger.debug(
+            "Project files: %d components, %d pages, %d public",
+            sum(path.startswith("src/components/") for path in project),
+            sum(path.startswith("src/pages/") for path in project),
+            sum(path.startswith("public/") for path in project)
+        )
     
     return state
 
@@ -768,77 +817,81 @@ def create_zip_file(state: AgentState) -> AgentState:
     """Create ZIP file from the React project structure"""
     
     if not state.get("react_project"):
-        print("❌ No React project to zip")
+        logger.warning("No React project to zip")
         return state
     
     # Create output directory
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
+    output_dir = "output"
+    os.makedirs(output_dir, exist_ok=True)
     
-    # Create unique ZIP filename
-    import time
-    timestamp = int(time.time())
-    zip_filename = f"react_website_{timestamp}.zip"
-    zip_path = output_dir / zip_filename
+    # Create unique ZIP filename; the timestamp alone collided when requests
+    # served concurrently finished in the same second, so mkstemp adds a
+    # random suffix and creates the file exclusively
+    timestamp = time.time_ns() // 1_000_000_000
     
     try:
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            project = state["react_project"]
-            
-            # Write all files to ZIP
-            def write_directory(directory_dict, base_path=""):
-                for filename, content in directory_dict.items():
-                    if isinstance(content, dict):
-                        # It's a subdirectory
-                        write_directory(content, f"{base_path}{filename}/")
-                    else:
-                        # It's a file
-                        file_path = f"{base_path}{filename}"
-                        zipf.writestr(file_path, content)
-                        print(f"   📄 Added: {file_path}")
+        fd, zip_path = tempfile.mkstemp(prefix=f"react_website_{timestamp}_", suffix=".zip", dir=output_dir)
+    except OSError:
+        logger.exception("Error creating ZIP file")
+        state["zip_path"] = None
+        return state
+    zip_filename = os.path.basename(zip_path)
+    
+    try:
+        # One large buffer turns the many small entry writes into a few syscalls
+        with (
+            open(fd, 'wb', buffering=_ZIP_BUFFER_SIZE) as raw,
+            zipfile.ZipFile(raw, 'w', zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL) as zipf
+        ):
+            logger.info("Creating ZIP file %s", zip_filename)
             
-            print(f"📦 Creating ZIP file: {zip_filename}")
-            write_directory(project)
+            # The project is already flat, so every entry is a file
+            for file_path, content in state["react_project"].items():
+                compress_type = zipfile.ZIP_STORED if len(content) < _ZIP_STORE_BELOW else None
+                zipf.writestr(file_path, content, compress_type=compress_type)
+                logger.debug("Added %s", file_path)
             
-        state["zip_path"] = str(zip_path)
-        print(f"✅ ZIP file created successfully: {zip_path}")
-        print(f"📊 ZIP file size: {zip_path.stat().st_size / 1024:.1f} KB")
-        
-    except Exception as e:
-        print(f"❌ Error creating ZIP file: {e}")
+    except Exception:
+        logger.exception("Error creating ZIP file")
+        # mkstemp already created the file, so remove the partial archive
+        with contextlib.suppress(OSError):
+            os.unlink(zip_path)
         state["zip_path"] = None
+        return state
+    
+    state["zip_path"] = zip_path
+    logger.info("ZIP file created: %s (%.1f KB)", zip_path, os.path.getsize(zip_path) / 1024)
     
     return state
 
+# Leading six hex digits of a color once its '#' is stripped; alpha digits may follow
+_HEX_RGB_PREFIX = re.compile(r'[0-9a-fA-F]{6}').match
+
+@lru_cache(maxsize=256)
 def adjust_color_brightness(hex_color: str, percent: int) -> str:
-    """Adjust color brightness by percentage (-100 to 100)"""
-    try:
-        # Remove # if present
-        hex_color = hex_color.lstrip('#')
-        
-        # Convert hex to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        
-        # Adjust brightness
-        factor = 1 + (percent / 100)
-        r = min(255, max(0, int(r * factor)))
-        g = min(255, max(0, int(g * factor)))
-        b = min(255, max(0, int(b * factor)))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
-    except:
-        return hex_color  # Return original if error
+    """Adjust color brightness by percentage (-100 to 100); cached since themes repeat"""
+    digits = hex_color.lstrip('#')
+    if not _HEX_RGB_PREFIX(digits):
+        return hex_color  # Return original if not a hex color
+    
+    # Convert hex to RGB in one C call
+    r, g, b = bytes.fromhex(digits[:6])
+    
+    # Adjust brightness
+    factor = 1 + (percent / 100)
+    r = min(255, max(0, int(r * factor)))
+    g = min(255, max(0, int(g * factor)))
+    b = min(255, max(0, int(b * factor)))
+    
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
 
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> str:
-    """Convert hex color to RGB values"""
-    try:
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return f"{r}, {g}, {b}"
-    except:
-        return "79, 70, 229"  # Default blue
\ No newline at end of file
+    """Convert hex color to RGB values; cached since themes repeat"""
+    digits = hex_color.lstrip('#')
+    if not _HEX_RGB_PREFIX(digits):
+        return "79, 70, 229"  # Default blue
+    
+    r, g, b = bytes.fromhex(digits[:6])
+    return f"{r}, {g}, {b}"
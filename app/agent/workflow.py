@@ -1,18 +1,19 @@
 import os
 import zipfile
 import json
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypedDict
 from langgraph.graph import Graph
-from groq import Groq
 from dotenv import load_dotenv
 from pydantic import BaseModel
 from typing import List, Optional
 
 # Import from modular files
 from .models import AgentState, WebsiteRequest, NavLink, Feature, PricingPlan, Testimonial, FAQItem
-from .llm_utils import groq_client, MODEL_NAME
+from .llm_utils import llm_fill_field, get_default_value
 from .code_utils import extract_code_and_css, extract_code, clean_imports
 from .css_utils import clean_css, add_professional_css_patterns
 from .logo_generator import generate_professional_logo
@@ -20,116 +21,12 @@ from .component_generator import generate_components
 from .page_generator import generate_pages
 from .project_compiler import compile_project, create_zip_file
 
-def llm_fill_field(field_name: str, field_description: str, context: dict) -> any:
-    """Use LLM to generate a default value for a missing field"""
-    
-    field_prompts = {
-        "website_desc": "Generate a professional, concise description (1-2 sentences) for a modern SaaS/tech platform.",
-        "landing_desc": "Generate a compelling hero section welcome message (1-2 sentences) that encourages visitors to explore the platform.",
-        "main_desc": "Generate a description for the main features page that showcases the platform's capabilities.",
-        "checkout_desc": "Generate an encouraging checkout page description that builds trust and motivates purchase completion.",
-        "primary_color": "Generate a modern, professional primary brand color in hex format (e.g., #4f46e5). Return only the hex color.",
-        "secondary_color": "Generate a complementary secondary brand color in hex format (e.g., #06b6d4). Return only the hex color.",
-        "logo_url": "Return an empty string - logos will be text-based.",
-        "nav_links": """Generate 5 navigation links as JSON array. Format: [{"name": "Home", "url": "/"}, {"name": "Features", "url": "/main"}, {"name": "Pricing", "url": "/#pricing"}, {"name": "About", "url": "/#about"}, {"name": "Get Started", "url": "/checkout"}]. Return only valid JSON array.""",
-        "features": """Generate 6 compelling features as JSON array. Format: [{"icon": "bi-star", "title": "Feature Name", "description": "Brief feature description"}]. Use Bootstrap icon names (bi-*). Return only valid JSON array.""",
-        "pricing": """Generate 3 pricing plans as JSON array. Format: [{"name": "Basic", "price": "$9/month", "features": ["Feature 1", "Feature 2", "Feature 3"], "recommended": false}, {"name": "Pro", "price": "$29/month", "features": ["Everything in Basic", "Feature 4", "Feature 5"], "recommended": true}, {"name": "Enterprise", "price": "$99/month", "features": ["Everything in Pro", "Feature 6", "Feature 7"], "recommended": false}]. Return only valid JSON array.""",
-        "testimonials": """Generate 4 customer testimonials as JSON array. Format: [{"name": "John Smith", "quote": "Great platform! Really improved our productivity.", "avatar": "https://via.placeholder.com/80x80/4f46e5/ffffff?text=JS"}]. Return only valid JSON array.""",
-        "faqs": """Generate 6 FAQs as JSON array. Format: [{"question": "How does it work?", "answer": "Detailed answer explaining the process."}]. Return only valid JSON array."""
-    }
-    
-    prompt = field_prompts.get(field_name, f"Generate appropriate content for {field_name}: {field_description}")
-    
-    # Add context if available
-    if context:
-        context_str = ", ".join([f"{k}: {v}" for k, v in context.items() if v])
-        prompt += f"\n\nContext from other fields: {context_str}"
-        prompt += "\n\nMake sure the generated content is consistent with the provided context."
-    
-    prompt += f"\n\nReturn ONLY the requested content in the exact format specified. No explanations or additional text."
-    
-    try:
-        response = groq_client.chat.completions.create(
-            model=MODEL_NAME,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-            max_tokens=1000,
-            timeout=30  # Add timeout
-        )
-        
-        content = response.choices[0].message.content.strip()
-        
-        # Try to parse JSON for array fields
-        if field_name in ["nav_links", "features", "pricing", "testimonials", "faqs"]:
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                # Extract JSON from content if wrapped in markdown
-                json_match = re.search(r'\[.*\]', content, re.DOTALL)
-                if json_match:
-                    return json.loads(json_match.group())
-                
-                # Return default values if JSON parsing fails
-                return get_default_value(field_name)
-        
-        return content
-        
-    except Exception as e:
-        print(f"Error generating field {field_name}: {e}")
-        return get_default_value(field_name)
-
-def get_default_value(field_name: str):
-    """Get default values for fields"""
-    defaults = {
-        "website_desc": "Modern AI-powered platform designed to boost productivity and streamline workflows",
-        "landing_desc": "Welcome to the future of productivity. Transform how you work with our innovative platform.",
-        "main_desc": "Discover powerful features designed to enhance your workflow and boost team collaboration.",
-        "checkout_desc": "Join thousands of satisfied customers. Choose your plan and start your journey today.",
-        "primary_color": "#4f46e5",
-        "secondary_color": "#06b6d4",
-        "logo_url": "",
-        "nav_links": [
-            {"name": "Home", "url": "/"},
-            {"name": "Features", "url": "/main"},
-            {"name": "Pricing", "url": "/#pricing"},
-            {"name": "About", "url": "/#about"},
-            {"name": "Get Started", "url": "/checkout"}
-        ],
-        "features": [
-            {"icon": "bi-lightning", "title": "Fast & Efficient", "description": "Lightning-fast performance for all your needs"},
-            {"icon": "bi-shield-check", "title": "Secure & Safe", "description": "Enterprise-grade security for your data"},
-            {"icon": "bi-people", "title": "Team Collaboration", "description": "Work together seamlessly with your team"},
-            {"icon": "bi-graph-up", "title": "Analytics & Insights", "description": "Detailed analytics to track your progress"},
-            {"icon": "bi-mobile", "title": "Mobile Ready", "description": "Access from anywhere on any device"},
-            {"icon": "bi-headset", "title": "24/7 Support", "description": "Round-the-clock customer support"}
-        ],
-        "pricing": [
-            {"name": "Starter", "price": "$9/month", "features": ["5 Projects", "10GB Storage", "Email Support"], "recommended": False},
-            {"name": "Professional", "price": "$29/month", "features": ["Unlimited Projects", "100GB Storage", "Priority Support", "Advanced Analytics"], "recommended": True},
-            {"name": "Enterprise", "price": "$99/month", "features": ["Everything in Pro", "Unlimited Storage", "Dedicated Support", "Custom Integrations"], "recommended": False}
-        ],
-        "testimonials": [
-            {"name": "Sarah Johnson", "quote": "This platform has transformed how we work. Highly recommended!", "avatar": "https://via.placeholder.com/80x80/4f46e5/ffffff?text=SJ"},
-            {"name": "Mike Chen", "quote": "Incredible features and excellent support team. Worth every penny.", "avatar": "https://via.placeholder.com/80x80/06b6d4/ffffff?text=MC"},
-            {"name": "Emily Davis", "quote": "User-friendly interface with powerful capabilities. Love it!", "avatar": "https://via.placeholder.com/80x80/10b981/ffffff?text=ED"},
-            {"name": "Alex Rodriguez", "quote": "Game-changer for our productivity. Couldn't imagine working without it.", "avatar": "https://via.placeholder.com/80x80/f59e0b/ffffff?text=AR"}
-        ],
-        "faqs": [
-            {"question": "How do I get started?", "answer": "Simply sign up for an account and follow our guided onboarding process."},
-            {"question": "Is there a free trial?", "answer": "Yes, we offer a 14-day free trial with full access to all features."},
-            {"question": "Can I cancel anytime?", "answer": "Absolutely! You can cancel your subscription at any time with no penalties."},
-            {"question": "What payment methods do you accept?", "answer": "We accept all major credit cards, PayPal, and bank transfers."},
-            {"question": "Is my data secure?", "answer": "Yes, we use enterprise-grade encryption and security measures to protect your data."},
-            {"question": "Do you offer customer support?", "answer": "Yes, we provide 24/7 customer support via email, chat, and phone."}
-        ]
-    }
-    
-    return defaults.get(field_name, "")
+logger = logging.getLogger(__name__)
 
 # Workflow Graph Functions
 def initialize_state(data: dict) -> AgentState:
     """Initialize state with user input and fill missing fields"""
-    print("🚀 Initializing website generation...")
+    logger.info("Initializing website generation")
     
     # Create state dictionary properly
     state = {
@@ -179,29 +76,29 @@ def initialize_state(data: dict) -> AgentState:
     for field_name, field_info in field_descriptions.items():
         if not state.get(field_name):
             try:
-                print(f"🔄 Generating {field_name}...")
+                logger.info("Generating %s", field_name)
                 state[field_name] = llm_fill_field(field_name, field_info, context)
                 context[field_name] = state[field_name]
-                print(f"✅ Generated {field_name}")
+                logger.info("Generated %s", field_name)
             except Exception as e:
-                print(f"❌ Error generating {field_name}: {e}")
+                logger.warning("Error generating %s, using default: %s", field_name, e)
                 state[field_name] = get_default_value(field_name)
                 context[field_name] = state[field_name]
     
-    print(f"🎯 State initialized with all required fields")
+    logger.info("State initialized with all required fields")
     return state
 
 def generate_logo_step(state: AgentState) -> AgentState:
     """Generate professional logo component"""
-    print("🎨 Generating logo component...")
+    logger.info("Generating logo component")
     
     try:
         logo_jsx, logo_css = generate_professional_logo(state)
         state["components"]["Logo"] = logo_jsx
         state["component_css"]["Logo"] = logo_css
-        print("✅ Logo component generated successfully")
-    except Exception as e:
-        print(f"❌ Error generating logo: {e}")
+        logger.info("Logo component generated")
+    except Exception:
+        logger.exception("Error generating logo, using fallback logo")
         # Add fallback logo
         state["components"]["Logo"] = """import React from 'react';
 import './Logo.css';
@@ -237,24 +134,30 @@ export default function Logo({ className = '' }) {
     
     return state
 
-def generate_components_step(state: AgentState) -> AgentState:
-    """Generate all React components"""
-    print("🧩 Generating React components...")
-    return generate_components(state)
-
-def generate_pages_step(state: AgentState) -> AgentState:
-    """Generate all pages"""
-    print("📄 Generating pages...")
-    return generate_pages(state)
+def generate_content_step(state: AgentState) -> AgentState:
+    """Generate all React components and pages"""
+    logger.info("Generating React components and pages")
+    
+    # Pages never read the generated components (only their names, which are
+    # fixed), so both LLM fan-outs run at once. They write disjoint state keys.
+    # Each fan-out runs its own per-call pool inside its worker here; this
+    # outer pool only overlaps the two, so it needs exactly two workers.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        components_done = executor.submit(generate_components, state)
+        pages_done = executor.submit(generate_pages, state)
+        components_done.result()
+        pages_done.result()
+    
+    return state
 
 def compile_step(state: AgentState) -> AgentState:
     """Compile the React project"""
-    print("🔧 Compiling React project...")
+    logger.info("Compiling React project")
     return compile_project(state)
 
 def create_zip_step(state: AgentState) -> AgentState:
     """Create downloadable ZIP file"""
-    print("📦 Creating ZIP file...")
+    logger.info("Creating ZIP file")
     return create_zip_file(state)
 
 # Create Workflow Graph
@@ -265,16 +168,14 @@ def create_workflow():
     # Add nodes
     workflow.add_node("initialize", initialize_state)
     workflow.add_node("generate_logo", generate_logo_step)
-    workflow.add_node("generate_components", generate_components_step)
-    workflow.add_node("generate_pages", generate_pages_step)
+    workflow.add_node("generate_content", generate_content_step)
     workflow.add_node("compile", compile_step)
     workflow.add_node("create_zip", create_zip_step)
     
     # Add edges (execution flow)
     workflow.add_edge("initialize", "generate_logo")
-    workflow.add_edge("generate_logo", "generate_components")
-    workflow.add_edge("generate_components", "generate_pages")
-    workflow.add_edge("generate_pages", "compile")
+    workflow.add_edge("generate_logo", "generate_content")
+    workflow.add_edge("generate_content", "compile")
     workflow.add_edge("compile", "create_zip")
     
     # Set entry point
@@ -304,7 +205,7 @@ def generate_website(
         str: Path to the generated ZIP file
     """
     
-    print("🌟 Starting website generation process...")
+    logger.info("Starting website generation")
     
     # Prepare input data
     input_data = {
@@ -329,16 +230,14 @@ def generate_website(
         
         zip_path = result.get("zip_path")
         if zip_path and Path(zip_path).exists():
-            print(f"🎉 Website generated successfully!")
-            print(f"📁 ZIP file created: {zip_path}")
-            print(f"📊 File size: {Path(zip_path).stat().st_size / 1024:.1f} KB")
+            logger.info("Website generated: %s (%.1f KB)", zip_path, Path(zip_path).stat().st_size / 1024)
             return zip_path
         else:
             raise Exception("ZIP file was not created successfully")
             
-    except Exception as e:
-        print(f"❌ Error during generation: {e}")
-        raise e
+    except Exception:
+        logger.exception("Error during generation")
+        raise
 
 # Compatibility functions for existing code
 def llm_fill_field_legacy(field_name: str, description: str, context: dict):
@@ -1,15 +1,29 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 from .agent.workflow import generate_website
 from .agent.models import WebsiteRequest
+from .agent.llm_utils import close_groq_client
 import json
+import logging
+
+# Surface progress logs from the generation pipeline alongside uvicorn's output
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled LLM API connections on shutdown
+    close_groq_client()
 
 app = FastAPI(
     title="React Website Generator",
     description="Generate complete React websites using AI with professional design patterns",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -67,8 +81,10 @@ async def generate_site(req: WebsiteRequest = None):
         # Convert Pydantic model to dict, filtering out None values
         req_dict = {k: v for k, v in req.dict().items() if v is not None}
         
-        # Generate the website using the new workflow
-        zip_path = generate_website(
+        # Generate the website using the new workflow. It blocks on LLM calls and
+        # ZIP writing, so it runs in the threadpool to keep the event loop free.
+        zip_path = await run_in_threadpool(
+            generate_website,
             website_desc=req_dict.get("website_desc", ""),
             landing_desc=req_dict.get("landing_desc", ""),
             main_desc=req_dict.get("main_desc", ""),